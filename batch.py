@@ -0,0 +1,342 @@
+"""Headless batch mode: watch a directory and schedule workload files as they arrive.
+
+    python main.py --watch incoming --out results --algorithms FCFS SRTF RR --workers 4
+    python batch.py --watch incoming --once
+
+main.py runs this module for --watch before it imports tkinter, so the
+watcher and its workers start on servers without Tk.
+
+Workload files are JSON (a list of process objects, or {"processes": [...]}),
+CSV with a header row (pid, arrival, burst or bursts, and any policy fields
+such as priority or tickets) or recorded scheduler traces (.trace, .trace.gz,
+see traces.py). A file is picked up once its size and modification time
+have stayed the same for one poll, so half-copied files are not read.
+
+Each file is simulated under every configured algorithm in a bounded pool of
+worker processes; at most one file per worker is in flight and the rest wait
+in a backlog. The worker writes <name>.results.csv (one row per process and
+algorithm) and <name>.stats.json (summary statistics per algorithm) to the
+output directory through a temporary file and os.replace, so readers never
+see a partial file. The watcher logs the latency of every file (from
+detection to its outputs being written) and keeps counters in status.json.
+"""
+import argparse
+import csv
+import json
+import os
+import signal
+import sys
+import tempfile
+import time
+from collections import deque
+
+import policies
+import scheduling
+import traces
+from scheduling import ALGORITHMS, REALTIME_ALGORITHMS
+
+WORKLOAD_SUFFIXES = ('.json', '.csv', '.trace', '.trace.gz')
+
+# Default algorithms: the classic ones run by "Compare All"
+DEFAULT_ALGORITHMS = [value for _, value in ALGORITHMS]
+
+
+def write_atomic(path, write):
+    """Write a text file through a temporary file in the same directory and rename it into place"""
+    directory, name = os.path.split(path)
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', newline='') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def normalize(records):
+    """Validate raw process records and fill in the fields the algorithms expect"""
+    processes = []
+    for i, record in enumerate(records):
+        pid = int(record.get('pid') or i + 1)
+        if record.get('bursts'):
+            bursts = record['bursts']
+            if isinstance(bursts, str):
+                bursts = bursts.replace(';', ',').split(',')
+            bursts = [int(b) for b in bursts]
+        else:
+            bursts = [int(record['burst'])]
+        arrival = int(record.get('arrival') or 0)
+        if arrival < 0 or any(b <= 0 for b in bursts) or len(bursts) % 2 == 0:
+            raise ValueError(f"Invalid values for Process P{pid}")
+
+        process = {key: value for key, value in record.items() if value not in ('', None)}
+        for key, value in process.items():
+            if isinstance(value, str):
+                try:
+                    process[key] = int(value)
+                except ValueError:
+                    pass
+        burst = sum(bursts[0::2])
+        process.update(pid=pid, arrival=arrival, burst=burst, remaining=burst)
+        process['bursts'] = bursts
+        process.setdefault('priority', 0)
+        processes.append(process)
+    return processes
+
+
+def load_workload(path):
+    """Read a workload file into process dicts"""
+    name = os.path.basename(path)
+    if name.endswith(('.trace', '.trace.gz')):
+        return traces.load_trace(path)
+    if name.endswith('.json'):
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data['processes']
+        return normalize(data)
+    if name.endswith('.csv'):
+        with open(path, newline='') as f:
+            return normalize(list(csv.DictReader(f)))
+    raise ValueError(f"Unknown workload format: {name}")
+
+
+def process_file(path, out_dir, algorithms, quantum=None, seed=None):
+    """Simulate one workload file under every algorithm and write its outputs (runs in a worker)"""
+    started = time.perf_counter()
+    name = os.path.basename(path)
+    processes = load_workload(path)
+    if not processes:
+        raise ValueError("No processes in workload")
+
+    trace = name.endswith(('.trace', '.trace.gz'))
+    rows = []
+    statistics = {}
+    for algorithm in algorithms:
+        try:
+            if trace:
+                traces.check_algorithm(algorithm)
+            run = scheduling.run_algorithm(
+                algorithm,
+                [dict(p) for p in processes],
+                quantum if scheduling.uses_quantum(algorithm) else None,
+                seed if scheduling.uses_seed(algorithm) else None
+            )
+        except KeyError as e:
+            statistics[algorithm] = {'error': f"Missing field {e}"}
+            continue
+        except ValueError as e:
+            statistics[algorithm] = {'error': str(e)}
+            continue
+        statistics[algorithm] = scheduling.compute_statistics(run['results'], run['gantt'])
+        rows.extend(dict(r, algorithm=algorithm) for r in run['results'] if r is not None)
+
+    fields = {'algorithm': None}
+    for keys in dict.fromkeys(map(tuple, rows)):
+        fields.update(dict.fromkeys(keys))
+
+    def write_results(f):
+        writer = csv.DictWriter(f, fieldnames=list(fields), extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+    elapsed = time.perf_counter() - started
+    summary = {'file': name, 'processes': len(processes), 'elapsed': elapsed, 'algorithms': statistics}
+    write_atomic(os.path.join(out_dir, f"{name}.results.csv"), write_results)
+    write_atomic(os.path.join(out_dir, f"{name}.stats.json"), lambda f: json.dump(summary, f, indent=2))
+    return {
+        'processes': len(processes),
+        'elapsed': elapsed,
+        'errors': {algorithm: s['error'] for algorithm, s in statistics.items() if s and 'error' in s}
+    }
+
+
+class BatchWatcher:
+    """Poll a directory and feed new or changed workload files to a bounded process pool"""
+
+    def __init__(self, directory, out_dir, algorithms=None, quantum=2, seed=1, workers=None,
+                 interval=1.0, log=print):
+        if os.path.abspath(directory) == os.path.abspath(out_dir):
+            raise ValueError("The output directory must differ from the watched directory")
+        self.directory = directory
+        self.out_dir = out_dir
+        self.algorithms = algorithms or DEFAULT_ALGORITHMS
+        self.quantum = quantum
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.interval = interval
+        self.log = log
+
+        self.seen = {}              # name -> (mtime, size, first seen) of files still settling
+        self.processed = {}         # name -> (mtime, size) last handed to the pool
+        self.backlog = deque()      # (name, detected) waiting for a free worker
+        self.running = {}           # future -> (name, detected)
+        self.counters = {'detected': 0, 'completed': 0, 'failed': 0}
+        self.latencies = []
+        self.executor = None
+        self.stopping = False
+
+    def scan(self, settle=True):
+        """Queue workload files that are new or changed and no longer being written"""
+        queued = {name for name, _ in self.backlog} | {name for name, _ in self.running.values()}
+        for entry in os.scandir(self.directory):
+            name = entry.name
+            if name.startswith('.') or not name.endswith(WORKLOAD_SUFFIXES) or name in queued:
+                continue
+            try:
+                stat = entry.stat()
+                if not entry.is_file():
+                    continue
+            except FileNotFoundError:
+                continue
+            key = (stat.st_mtime_ns, stat.st_size)
+            if self.processed.get(name) == key:
+                continue
+            if name not in self.processed and self.up_to_date(name, stat.st_mtime):
+                self.processed[name] = key      # handled before a restart
+                continue
+
+            now = time.time()
+            previous = self.seen.get(name)
+            if settle and (previous is None or previous[:2] != key):
+                self.seen[name] = key + (previous[2] if previous else now,)
+                continue
+            self.seen.pop(name, None)
+            self.processed[name] = key
+            self.backlog.append((name, previous[2] if previous else now))
+            self.counters['detected'] += 1
+
+    def up_to_date(self, name, mtime):
+        """Whether the outputs of a file are newer than the file itself"""
+        try:
+            return os.stat(os.path.join(self.out_dir, f"{name}.stats.json")).st_mtime >= mtime
+        except FileNotFoundError:
+            return False
+
+    def dispatch(self):
+        """Start backlogged files while fewer than workers are in flight"""
+        while self.backlog and len(self.running) < self.workers:
+            name, detected = self.backlog.popleft()
+            future = self.executor.submit(
+                process_file, os.path.join(self.directory, name), self.out_dir,
+                self.algorithms, self.quantum, self.seed
+            )
+            self.running[future] = (name, detected)
+
+    def collect(self):
+        """Log finished files; return whether any finished"""
+        finished = [future for future in self.running if future.done()]
+        for future in finished:
+            name, detected = self.running.pop(future)
+            latency = time.time() - detected
+            try:
+                outcome = future.result()
+            except Exception as e:
+                self.counters['failed'] += 1
+                self.log(f"{name}: failed: {e}")
+                continue
+            self.counters['completed'] += 1
+            self.latencies.append(latency)
+            message = (f"{name}: {outcome['processes']} processes, {len(self.algorithms)} algorithms "
+                       f"in {outcome['elapsed']:.3f}s, latency {latency:.3f}s, "
+                       f"backlog {len(self.backlog)}, running {len(self.running)}")
+            for algorithm, error in outcome['errors'].items():
+                message += f"\n  {algorithm}: {error}"
+            self.log(message)
+        return bool(finished)
+
+    def status(self):
+        """Counters and latency summary"""
+        latencies = self.latencies
+        return dict(
+            self.counters,
+            backlog=len(self.backlog),
+            running=len(self.running),
+            settling=len(self.seen),
+            latency_mean=sum(latencies) / len(latencies) if latencies else None,
+            latency_max=max(latencies) if latencies else None,
+            latency_last=latencies[-1] if latencies else None
+        )
+
+    def write_status(self):
+        status = self.status()
+        write_atomic(os.path.join(self.out_dir, 'status.json'), lambda f: json.dump(status, f, indent=2))
+
+    def poll(self, settle=True):
+        """One watcher cycle: collect results, scan the directory, start work"""
+        before = (dict(self.counters), len(self.backlog), len(self.running))
+        self.collect()
+        self.scan(settle)
+        self.dispatch()
+        if (self.counters, len(self.backlog), len(self.running)) != before:
+            self.write_status()
+
+    def stop(self, *args):
+        """Finish the current cycle and leave run() (also the SIGTERM handler)"""
+        self.stopping = True
+
+    def run(self, once=False):
+        """Watch until interrupted or stopped; with once, process the files present now and return"""
+        import concurrent.futures
+        import multiprocessing
+
+        signal.signal(signal.SIGTERM, self.stop)
+        os.makedirs(self.out_dir, exist_ok=True)
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self.log(f"Watching {self.directory} with {self.workers} workers, "
+                 f"writing to {self.out_dir} ({', '.join(self.algorithms)})")
+        try:
+            while not self.stopping:
+                self.poll(settle=not once)
+                if once and not self.backlog and not self.running:
+                    break
+                time.sleep(self.interval if not once else 0.05)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.write_status()
+        status = self.status()
+        self.log(f"{status['completed']} files done, {status['failed']} failed, "
+                 f"{status['backlog'] + status['running']} unfinished")
+        return status
+
+
+def watch(directory, out_dir=None, algorithms=None, quantum=2, seed=1, workers=None,
+          interval=1.0, once=False):
+    """Run the watcher (see BatchWatcher); returns a process exit code"""
+    if out_dir is None:
+        out_dir = os.path.join(directory, 'results')
+    watcher = BatchWatcher(directory, out_dir, algorithms, quantum, seed, workers, interval)
+    status = watcher.run(once)
+    return 1 if status['failed'] else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0], allow_abbrev=False)
+    parser.add_argument('--watch', metavar='DIR', required=True,
+                        help="process workload files arriving in DIR without opening the window")
+    parser.add_argument('--out', metavar='DIR',
+                        help="directory for results and statistics (default: DIR/results)")
+    parser.add_argument('--algorithms', nargs='+', metavar='NAME',
+                        choices=list(policies.POLICIES) + [value for _, value in REALTIME_ALGORITHMS],
+                        help="algorithms to run on every file (default: those of Compare All)")
+    parser.add_argument('--quantum', type=int, default=2, help="time quantum for RR, Lottery and Stride")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for Lottery")
+    parser.add_argument('--workers', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between directory scans")
+    parser.add_argument('--once', action='store_true',
+                        help="process the files present and exit instead of watching")
+    args = parser.parse_args(argv)
+
+    return watch(args.watch, args.out, args.algorithms, args.quantum, args.seed,
+                 args.workers, args.interval, args.once)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
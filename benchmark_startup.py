@@ -0,0 +1,82 @@
+"""Startup-time benchmark for the OS Process Management Calculator.
+
+Each run starts a fresh interpreter, constructs the application without
+entering the main loop and pumps events until the deferred panels exist.
+Reports the median time to import main.py, to paint the window shell and
+to have the full interface ready, plus any heavy modules that were loaded
+during startup (these should all be imported lazily).
+
+Usage:
+    python benchmark_startup.py [--runs N]
+
+Requires a display (on headless machines run it under xvfb-run).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ['numpy', 'concurrent.futures', 'multiprocessing', 'sqlite3']
+
+CHILD = '''
+import json, sys, time
+t0 = time.perf_counter()
+import main
+imported = time.perf_counter()
+app = main.OSProcessCalculator(mainloop=False)
+while 'ready' not in app.startup_times:
+    app.root.update()
+app.root.update()
+times = app.startup_times
+print(json.dumps({
+    'import': imported - t0,
+    'shell': times['shell'] - t0,
+    'ready': times['ready'] - t0,
+    'heavy': [m for m in %r if m in sys.modules]
+}))
+app.root.destroy()
+''' % HEAVY_MODULES
+
+
+def run_once():
+    """Measure one cold start in a fresh interpreter"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD],
+        cwd=here,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    sample = json.loads(output.strip().splitlines()[-1])
+    sample['process'] = time.perf_counter() - started
+    return sample
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help="number of cold starts to measure")
+    args = parser.parse_args()
+
+    try:
+        samples = [run_once() for _ in range(args.runs)]
+    except subprocess.CalledProcessError as e:
+        sys.exit(f"Startup failed (is a display available?)\n{e.stderr}")
+
+    print(f"Startup over {args.runs} runs (median, ms)")
+    for key, label in [('import', "Import main.py"),
+                       ('shell', "Window shell painted"),
+                       ('ready', "Interface ready"),
+                       ('process', "Whole process incl. teardown")]:
+        print(f"  {label:<30}{statistics.median(s[key] for s in samples) * 1000:8.1f}")
+
+    heavy = sorted({m for s in samples for m in s['heavy']})
+    print(f"  Heavy modules loaded at startup: {', '.join(heavy) if heavy else 'none'}")
+
+
+if __name__ == '__main__':
+    main()
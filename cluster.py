@@ -0,0 +1,264 @@
+"""Multi-node cluster simulation behind a load-balancing dispatcher.
+
+Jobs arrive at a front dispatcher, which sends each one to one of N nodes;
+the job reaches its node after the dispatch latency. Every node is an
+engine.Engine running a per-node policy (FCFS, RR, SRTF, ...). Dispatchers:
+
+    round_robin    nodes in turn
+    least_loaded   node with the least outstanding CPU work
+    power_of_two   the less loaded of two nodes drawn at random (seeded)
+    jsq            join the shortest queue: node with the fewest unfinished jobs
+
+A dispatcher sees the nodes as they are at the job's arrival, counting the
+jobs it has sent that are still in flight.
+
+Round-robin ignores node state, so the jobs can be partitioned up front and
+the nodes simulated in parallel worker processes. The outstanding work of a
+node that never idles while it has work does not depend on its policy, so
+least_loaded and power_of_two are partitioned the same way by replaying
+the arrivals (Lindley's recursion) when no job blocks on I/O. JSQ, and
+work-based dispatch of I/O-bound jobs, depend on how each node schedules;
+the nodes are then co-simulated in one process, advanced to each arrival
+before the dispatcher looks at them.
+"""
+import math
+import os
+import random
+from collections import deque
+
+import engine
+import policies
+
+DISPATCHERS = ('round_robin', 'least_loaded', 'power_of_two', 'jsq')
+
+# Dispatchers whose choices depend on outstanding work only
+WORK_DISPATCHERS = ('least_loaded', 'power_of_two')
+
+
+class WorkTracker:
+    """Outstanding CPU work of a work-conserving node, without simulating its policy"""
+
+    def __init__(self):
+        self.work = 0           # unfinished work that had reached the node by time
+        self.time = 0
+        self.in_flight = deque()    # (arrival at node, work) not yet folded in
+        self.in_flight_work = 0
+
+    def add(self, arrival, work):
+        self.in_flight.append((arrival, work))
+        self.in_flight_work += work
+
+    def backlog(self, now):
+        """Work sent to the node and not yet served at time now"""
+        while self.in_flight and self.in_flight[0][0] < now:
+            arrival, work = self.in_flight.popleft()
+            self.in_flight_work -= work
+            self.work = max(0, self.work - (arrival - self.time)) + work
+            self.time = arrival
+        self.work = max(0, self.work - (now - self.time))
+        self.time = now
+        return self.work + self.in_flight_work
+
+
+def choose(dispatcher, now, count, turn, rng, backlog, unfinished):
+    """Node for the job arriving at now (ties go to the lowest node number)"""
+    if dispatcher == 'round_robin':
+        return turn % count
+    if dispatcher == 'least_loaded':
+        return min(range(count), key=lambda k: (backlog(k, now), k))
+    if dispatcher == 'power_of_two':
+        if count == 1:
+            return 0
+        first, second = sorted(rng.sample(range(count), 2))
+        return first if backlog(first, now) <= backlog(second, now) else second
+    if dispatcher == 'jsq':
+        return min(range(count), key=lambda k: (unfinished(k), k))
+    raise ValueError(f"Unknown dispatcher: {dispatcher}")
+
+
+def node_process(process, latency):
+    """Copy of a process as it arrives at its node"""
+    return dict(process, arrival=process['arrival'] + latency)
+
+
+def simulate_node(jobs, policy, quantum=None, seed=None, devices=1):
+    """Run the jobs dispatched to one node (safe to call from worker processes)"""
+    return engine.simulate(jobs, policy, quantum, devices=devices, seed=seed)
+
+
+def partition(processes, count, dispatcher, latency, rng):
+    """Assign jobs to nodes up front for dispatchers that do not depend on node policies"""
+    trackers = [WorkTracker() for _ in range(count)]
+
+    def backlog(k, now):
+        return trackers[k].backlog(now)
+
+    assignment = [[] for _ in range(count)]
+    for turn, process in enumerate(processes):
+        k = choose(dispatcher, process['arrival'], count, turn, rng, backlog, None)
+        job = node_process(process, latency)
+        assignment[k].append(job)
+        if dispatcher != 'round_robin':
+            trackers[k].add(job['arrival'], sum(engine.get_bursts(process)[0::2]))
+    return assignment
+
+
+def co_simulate(processes, count, node_policies, dispatcher, latency, quantum, seed, devices, rng):
+    """Simulate all nodes together, advancing them to every arrival before dispatching it"""
+    nodes = [engine.Engine(policies.create(node_policies[k], quantum, seed), devices)
+             for k in range(count)]
+
+    def backlog(k, now):
+        return nodes[k].backlog(now)
+
+    def unfinished(k):
+        return nodes[k].unfinished
+
+    for turn, process in enumerate(processes):
+        now = process['arrival']
+        for node in nodes:
+            if node.next_event() < now:
+                node.advance(now)
+        k = choose(dispatcher, now, count, turn, rng, backlog, unfinished)
+        nodes[k].submit(node_process(process, latency))
+
+    outcomes = []
+    for node in nodes:
+        node.advance()
+        outcomes.append(node.result())
+    return outcomes
+
+
+def plan(processes, nodes, policy="FCFS", dispatcher="round_robin", latency=0,
+         quantum=None, seed=None, parallel=None):
+    """Validate a cluster run and partition its jobs if the nodes can run independently
+
+    Arguments are those of simulate(). Returns 'policies' (one per node),
+    'processes' (sorted by arrival), 'rng' (the dispatcher's random
+    stream) and 'assignment': the jobs of each node as they arrive there,
+    or None when the nodes must be co-simulated. Each node of an
+    assignment can be run with simulate_node and the outcomes merged with
+    summarize.
+    """
+    if nodes < 1:
+        raise ValueError("A cluster needs at least one node")
+    if dispatcher not in DISPATCHERS:
+        raise ValueError(f"Unknown dispatcher: {dispatcher}")
+    if latency < 0:
+        raise ValueError("Dispatch latency must not be negative")
+    node_policies = [policy] * nodes if isinstance(policy, str) else list(policy)
+    if len(node_policies) != nodes:
+        raise ValueError("Give one policy per node")
+    for name in node_policies:
+        policies.create(name, quantum, seed)    # validate before dispatching
+
+    processes = sorted(processes, key=lambda p: p['arrival'])
+    rng = random.Random(seed)
+    blocking = any(len(engine.get_bursts(p)) > 1 for p in processes)
+    if parallel is None:
+        parallel = dispatcher == 'round_robin' or (dispatcher in WORK_DISPATCHERS and not blocking)
+    elif parallel and (dispatcher == 'jsq' or (dispatcher in WORK_DISPATCHERS and blocking)):
+        raise ValueError(f"The {dispatcher} dispatcher depends on node policies and cannot run in parallel")
+
+    assignment = partition(processes, nodes, dispatcher, latency, rng) if parallel else None
+    return {'policies': node_policies, 'processes': processes, 'rng': rng, 'assignment': assignment}
+
+
+def simulate(processes, nodes, policy="FCFS", dispatcher="round_robin", latency=0,
+             quantum=None, seed=None, devices=1, workers=None, parallel=None):
+    """Dispatch processes across nodes and simulate every node
+
+    policy is one registered policy name for all nodes or a list with one
+    per node; devices is the number of I/O devices per node. workers caps
+    the worker processes (1 simulates in this process), and parallel=False
+    forces co-simulation even when the jobs could be partitioned.
+
+    Returns 'results' (one row per job in pid order, with its 'node'; times
+    count from the arrival at the dispatcher, so 'turnaround' and 'waiting'
+    include the latency), 'nodes' (per-node metrics and Gantt timeline),
+    'metrics' (cluster-wide) and 'parallel' (whether the nodes ran
+    independently).
+    """
+    run = plan(processes, nodes, policy, dispatcher, latency, quantum, seed, parallel)
+    node_policies = run['policies']
+    assignment = run['assignment']
+
+    if assignment is not None:
+        if workers is None:
+            workers = min(nodes, os.cpu_count() or 1)
+        if workers > 1:
+            import concurrent.futures
+            import multiprocessing
+
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                futures = [executor.submit(simulate_node, assignment[k], node_policies[k],
+                                           quantum, seed, devices)
+                           for k in range(nodes)]
+                outcomes = [future.result() for future in futures]
+        else:
+            outcomes = [simulate_node(assignment[k], node_policies[k], quantum, seed, devices)
+                        for k in range(nodes)]
+    else:
+        outcomes = co_simulate(run['processes'], nodes, node_policies, dispatcher, latency,
+                               quantum, seed, devices, run['rng'])
+
+    return summarize(outcomes, node_policies, latency, assignment is not None)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of sorted values"""
+    if not values:
+        return 0
+    return values[min(len(values) - 1, max(0, math.ceil(fraction * len(values)) - 1))]
+
+
+def summarize(outcomes, node_policies, latency, parallel):
+    """Merge per-node outcomes into job rows, per-node and cluster-wide metrics"""
+    results = []
+    node_rows = []
+    for k, outcome in enumerate(outcomes):
+        rows = outcome['results']
+        for r in rows:
+            results.append(dict(
+                r,
+                node=k,
+                arrival=r['arrival'] - latency,
+                turnaround=r['turnaround'] + latency,
+                waiting=r['waiting'] + latency
+            ))
+        busy = outcome['gantt'].busy_time()
+        node_rows.append({
+            'node': k,
+            'policy': node_policies[k],
+            'jobs': len(rows),
+            'busy': busy,
+            'completion': max((r['completion'] for r in rows), default=0),
+            'avg_turnaround': sum(r['turnaround'] for r in rows) / len(rows) + latency if rows else 0,
+            'avg_waiting': sum(r['waiting'] for r in rows) / len(rows) + latency if rows else 0,
+            'gantt': outcome['gantt']
+        })
+    results.sort(key=lambda r: r['pid'])
+
+    makespan = max((row['completion'] for row in node_rows), default=0)
+    for row in node_rows:
+        row['cpu_utilization'] = row['busy'] / makespan if makespan else 0
+
+    count = len(results)
+    turnarounds = sorted(r['turnaround'] for r in results)
+    busy = [row['busy'] for row in node_rows]
+    mean_busy = sum(busy) / len(busy)
+    metrics = {
+        'jobs': count,
+        'nodes': len(node_rows),
+        'avg_turnaround': sum(turnarounds) / count if count else 0,
+        'avg_waiting': sum(r['waiting'] for r in results) / count if count else 0,
+        'p95_turnaround': percentile(turnarounds, 0.95),
+        'max_turnaround': turnarounds[-1] if turnarounds else 0,
+        'makespan': makespan,
+        'throughput': count / makespan if makespan else 0,
+        'cpu_utilization': sum(busy) / (makespan * len(busy)) if makespan else 0,
+        'imbalance': max(busy) / mean_busy if mean_busy else 1.0
+    }
+    return {'results': results, 'nodes': node_rows, 'metrics': metrics, 'parallel': parallel}
@@ -0,0 +1,398 @@
+"""Event-driven scheduling engine for processes that alternate CPU and I/O bursts.
+
+A process may carry a ``bursts`` sequence ``[cpu, io, cpu, io, ..., cpu]``.
+CPU bursts are scheduled by a policy (see policies.py); I/O bursts are served
+by a pool of identical devices fed from one FCFS device queue. Time advances
+from event to event (arrivals and I/O completions from heaps, and the single
+running CPU slice), so the cost is O(log n) per burst rather than per time
+unit, whichever policy decides the order.
+
+The engine is incremental: processes can be submitted while it runs and
+advance(until) processes the events before a given time, which lets a
+dispatcher inspect its state between arrivals. simulate() runs a whole
+workload in one call, submitting it with submit_all(), which validates and
+stores the processes column by column instead of one at a time.
+"""
+import bisect
+import heapq
+import math
+from collections import deque
+from itertools import islice
+from operator import gt, itemgetter, sub
+
+import policies
+from timeline import GanttTimeline
+
+
+def get_bursts(process):
+    """Return the CPU/IO burst sequence of a process (a single CPU burst by default)"""
+    bursts = process.get('bursts')
+    return list(bursts) if bursts else [process['burst']]
+
+
+class Engine:
+    """One CPU and a pool of I/O devices driven by a scheduling policy"""
+
+    def __init__(self, policy, devices=1):
+        if devices <= 0:
+            raise ValueError("Number of devices must be positive")
+        self.policy = policy
+        self.devices = devices
+
+        # Per-process state, indexed by submission order
+        self.processes = []
+        self.pids = []
+        self.arrival = []
+        self.bursts = []
+        self.position = []          # index of the current burst in the sequence
+        self.remaining = []         # remaining time of the current CPU burst
+        self.first_start = []
+        self.completion = []
+        self.io_wait = []
+        self.queued_at = []         # when the process joined the device queue
+
+        self.arrivals = deque()     # (arrival, process) in arrival order
+        self.io_events = []         # heap of (time, seq, process, device)
+        self.device_queue = deque()
+        self.free_devices = list(range(devices))
+        self.seq = 0
+
+        self.gantt = GanttTimeline()
+        self.io_gantt = []
+        self.ready_deltas = []      # (time, +1/-1) as processes join/leave the ready queue
+        self.cpu_busy = 0
+        self.io_busy = 0
+        self.work_left = 0          # CPU work of unfinished processes, as of slice_start
+
+        self.running = None
+        self.slice_start = 0
+        self.slice_end = 0
+        self.dispatched = 0
+        self.ready_count = 0
+        self.time = 0
+        self.done = 0
+
+        # Policies that neither override on_submit nor read process fields
+        # need no call per submitted process
+        self.checks_submit = bool(policy.fields) or type(policy).on_submit is not policies.Policy.on_submit
+        policy.bind(self)
+
+    def submit(self, process):
+        """Add a process arriving no earlier than the engine's current time"""
+        bursts = get_bursts(process)
+        if len(bursts) % 2 == 0 or any(b <= 0 for b in bursts):
+            raise ValueError(f"Invalid burst sequence for Process P{process['pid']}")
+        arrival = process['arrival']
+        if arrival < self.time:
+            raise ValueError(f"Process P{process['pid']} arrives before the current time")
+
+        i = len(self.processes)
+        self.processes.append(process)
+        self.pids.append(process['pid'])
+        self.arrival.append(arrival)
+        self.bursts.append(bursts)
+        self.position.append(0)
+        self.remaining.append(0)
+        self.first_start.append(None)
+        self.completion.append(None)
+        self.io_wait.append(0)
+        self.queued_at.append(0)
+        self.work_left += sum(bursts[0::2])
+        if self.checks_submit:
+            self.policy.on_submit(i)
+        if self.arrivals and arrival < self.arrivals[-1][0]:
+            self.arrivals.insert(bisect.bisect_right(self.arrivals, (arrival, i)), (arrival, i))
+        else:
+            self.arrivals.append((arrival, i))
+        return i
+
+    def submit_all(self, processes):
+        """Add processes arriving no earlier than the current time, as one batch
+
+        Equivalent to calling submit for each process in order, but every
+        check and per-process list is handled column-wise.
+        """
+        processes = list(processes)
+        first = len(self.processes)
+        count = len(processes)
+        if not count:
+            return
+
+        pids = list(map(itemgetter('pid'), processes))
+        arrival = list(map(itemgetter('arrival'), processes))
+        bursts = [list(p['bursts']) if p.get('bursts') else [p['burst']] for p in processes]
+        if set(map(len, bursts)) == {1}:
+            cpu = list(map(itemgetter(0), bursts))
+            valid = min(cpu) > 0
+        else:
+            cpu = [sum(seq[0::2]) for seq in bursts]
+            valid = all(len(seq) % 2 and min(seq) > 0 for seq in bursts)
+        if not valid:
+            bad = next(k for k, seq in enumerate(bursts) if len(seq) % 2 == 0 or min(seq) <= 0)
+            raise ValueError(f"Invalid burst sequence for Process P{pids[bad]}")
+        if min(arrival) < self.time:
+            late = next(k for k, a in enumerate(arrival) if a < self.time)
+            raise ValueError(f"Process P{pids[late]} arrives before the current time")
+
+        self.processes.extend(processes)
+        self.pids.extend(pids)
+        self.arrival.extend(arrival)
+        self.bursts.extend(bursts)
+        self.position.extend([0] * count)
+        self.remaining.extend([0] * count)
+        self.first_start.extend([None] * count)
+        self.completion.extend([None] * count)
+        self.io_wait.extend([0] * count)
+        self.queued_at.extend([0] * count)
+        self.work_left += sum(cpu)
+        if self.checks_submit:
+            for i in range(first, first + count):
+                self.policy.on_submit(i)
+
+        # Stable sort by arrival keeps submission order among equal arrivals
+        if any(map(gt, arrival, islice(arrival, 1, None))):
+            order = sorted(range(count), key=arrival.__getitem__)
+            queued = [(arrival[k], first + k) for k in order]
+        else:
+            queued = list(zip(arrival, range(first, first + count)))
+        if self.arrivals and queued[0] < self.arrivals[-1]:
+            queued = heapq.merge(self.arrivals, queued)
+            self.arrivals = deque(queued)
+        else:
+            self.arrivals.extend(queued)
+
+    @property
+    def unfinished(self):
+        """Number of submitted processes that have not completed"""
+        return len(self.processes) - self.done
+
+    def backlog(self, now):
+        """CPU work still owed to submitted processes at time now"""
+        if self.running is not None:
+            return self.work_left - (min(now, self.slice_end) - self.slice_start)
+        return self.work_left
+
+    def next_event(self):
+        """Time of the next pending event (math.inf when idle)"""
+        upcoming = self.slice_end if self.running is not None else math.inf
+        if self.io_events and self.io_events[0][0] < upcoming:
+            upcoming = self.io_events[0][0]
+        if self.arrivals and self.arrivals[0][0] < upcoming:
+            upcoming = self.arrivals[0][0]
+        return upcoming
+
+    def advance(self, until=math.inf):
+        """Process every event before until (all of them by default)"""
+        policy = self.policy
+        on_arrival = policy.on_arrival
+        on_preempt = policy.on_preempt
+        on_complete = policy.on_complete
+        pick_next = policy.pick_next
+        time_slice = policy.time_slice
+        should_preempt = policy.should_preempt
+        preemptive = policy.preemptive
+
+        pids = self.pids
+        bursts = self.bursts
+        position = self.position
+        remaining = self.remaining
+        first_start = self.first_start
+        completion = self.completion
+        queued_at = self.queued_at
+        arrivals = self.arrivals
+        io_events = self.io_events
+        device_queue = self.device_queue
+        free_devices = self.free_devices
+        ready_deltas = self.ready_deltas
+        append_segment = self.gantt.append
+        next_arrival = arrivals.popleft
+        heappop = heapq.heappop
+        inf = math.inf
+
+        running = self.running
+        slice_start = self.slice_start
+        slice_end = self.slice_end
+        dispatched = self.dispatched
+        ready_count = self.ready_count
+        time = self.time
+        done = self.done
+        busy = 0                    # CPU time recorded by this call
+
+        while True:
+            # Next event time: arrival, I/O completion or end of the running slice
+            upcoming = slice_end if running is not None else inf
+            if io_events and io_events[0][0] < upcoming:
+                upcoming = io_events[0][0]
+            if arrivals and arrivals[0][0] < upcoming:
+                upcoming = arrivals[0][0]
+            if upcoming >= until:
+                break
+            time = upcoming
+
+            # Arrivals and I/O completions join the ready queue before a process
+            # whose quantum expired at the same instant is re-queued
+            while arrivals and arrivals[0][0] <= time:
+                i = next_arrival()[1]
+                remaining[i] = bursts[i][0]
+                ready_count += 1
+                ready_deltas.append((time, 1))
+                on_arrival(i, time)
+
+            while io_events and io_events[0][0] <= time:
+                _, _, i, device = heappop(io_events)
+                position[i] += 1
+                remaining[i] = bursts[i][position[i]]
+                ready_count += 1
+                ready_deltas.append((time, 1))
+                on_arrival(i, time)
+                if device_queue:
+                    self.start_io(device_queue.popleft(), device, time)
+                else:
+                    free_devices.append(device)
+
+            if running is not None and slice_end <= time:
+                i = running
+                running = None
+                busy += slice_end - slice_start
+                append_segment(pids[i], slice_start, slice_end)
+                remaining[i] -= slice_end - slice_start
+
+                if remaining[i] > 0:
+                    # Quantum expired
+                    ready_count += 1
+                    ready_deltas.append((time, 1))
+                    on_preempt(i, time, time - dispatched)
+                else:
+                    on_complete(i, time, time - dispatched)
+                    if position[i] + 1 == len(bursts[i]):
+                        completion[i] = time
+                        done += 1
+                    else:
+                        position[i] += 1
+                        queued_at[i] = time
+                        if free_devices:
+                            self.start_io(i, free_devices.pop(), time)
+                        else:
+                            device_queue.append(i)
+
+            # Preempt the running process if a better one became ready
+            if preemptive and running is not None and ready_count:
+                # Account for the elapsed part of the slice either way
+                remaining[running] -= time - slice_start
+                busy += time - slice_start
+                append_segment(pids[running], slice_start, time)
+                slice_start = time
+                if should_preempt(running, time):
+                    ready_count += 1
+                    ready_deltas.append((time, 1))
+                    on_preempt(running, time, time - dispatched)
+                    running = None
+
+            if running is None and ready_count:
+                i = pick_next(time)
+                ready_count -= 1
+                ready_deltas.append((time, -1))
+                running = i
+                slice_start = dispatched = time
+                if first_start[i] is None:
+                    first_start[i] = time
+                slice_end = time + time_slice(i)
+
+        self.running = running
+        self.slice_start = slice_start
+        self.slice_end = slice_end
+        self.dispatched = dispatched
+        self.ready_count = ready_count
+        self.time = time
+        self.done = done
+        self.cpu_busy += busy
+        self.work_left -= busy
+
+    def start_io(self, i, device, now):
+        """Start the current I/O burst of process i on a free device"""
+        length = self.bursts[i][self.position[i]]
+        self.io_wait[i] += now - self.queued_at[i]
+        self.io_busy += length
+        self.io_gantt.append({'pid': self.pids[i], 'device': device,
+                              'start': now, 'end': now + length})
+        heapq.heappush(self.io_events, (now + length, self.seq, i, device))
+        self.seq += 1
+
+    def result(self):
+        """Results of a finished simulation, in the format of simulate()"""
+        if self.done < len(self.processes):
+            raise ValueError("Simulation has unfinished processes")
+
+        pids = self.pids
+        if any(map(gt, pids, islice(pids, 1, None))):
+            order = sorted(range(len(pids)), key=pids.__getitem__)
+
+            def in_order(column):
+                return list(map(column.__getitem__, order))
+        else:
+            order = range(len(pids))
+
+            def in_order(column):
+                return column
+        bursts = in_order(self.bursts)
+        if set(map(len, bursts)) == {1}:
+            cpu = list(map(itemgetter(0), bursts))
+            io = [0] * len(bursts)
+        else:
+            cpu = [sum(seq[0::2]) for seq in bursts]
+            io = [sum(seq[1::2]) for seq in bursts]
+        arrival = in_order(self.arrival)
+        completion = in_order(self.completion)
+        io_wait = in_order(self.io_wait)
+        turnaround = list(map(sub, completion, arrival))
+        waiting = list(map(sub, map(sub, map(sub, turnaround, cpu), io), io_wait))
+        columns = {
+            'pid': in_order(pids),
+            'arrival': arrival,
+            'burst': cpu,
+            'io': io,
+            'start': in_order(self.first_start),
+            'completion': completion,
+            'turnaround': turnaround,
+            'waiting': waiting,
+            'io_wait': io_wait
+        }
+        results = [
+            {'pid': pid, 'arrival': arrival, 'burst': burst, 'io': io, 'start': start,
+             'completion': completion, 'turnaround': turnaround, 'waiting': waiting, 'io_wait': io_wait}
+            for pid, arrival, burst, io, start, completion, turnaround, waiting, io_wait
+            in zip(*columns.values())
+        ]
+        extra = self.policy.report(order)
+        if extra:
+            names = list(extra)
+            for result, values in zip(results, zip(*extra.values())):
+                result.update(zip(names, values))
+            columns.update(extra)
+
+        makespan = max(self.completion) if pids else 0
+        metrics = {
+            'cpu_utilization': self.cpu_busy / makespan if makespan else 0,
+            'device_utilization': self.io_busy / (makespan * self.devices) if makespan else 0,
+            'devices': self.devices
+        }
+        deltas = {'ready': self.ready_deltas, 'completed': self.completion}
+        return {'results': results, 'columns': columns, 'gantt': self.gantt,
+                'io_gantt': self.io_gantt, 'metrics': metrics, 'deltas': deltas}
+
+
+def simulate(processes, algorithm, quantum=None, devices=1, seed=None):
+    """Simulate processes with CPU/IO burst sequences under a scheduling policy
+
+    algorithm is a registered policy name (or a policy instance). Returns a
+    dict with 'results' (one entry per process, in pid order), 'gantt' (a
+    GanttTimeline of CPU segments), 'io_gantt' (device segments), 'metrics'
+    (CPU and device utilization), 'deltas' (ready-queue changes and
+    completion times, see timeseries.TimeSeries) and 'columns' (the results
+    as one list per field, for consumers that work column-wise). Policies add their own
+    result columns, e.g. 'share' and 'entitlement' for Lottery and Stride.
+    """
+    engine = Engine(policies.create(algorithm, quantum, seed), devices)
+    engine.submit_all(processes)
+    engine.advance()
+    return engine.result()
@@ -0,0 +1,167 @@
+"""Differential fuzzer: the event engine against the reference algorithms.
+
+Every optimized scheduler must produce exactly the schedules of the
+original step-by-step implementations (scheduling.fcfs, sjf, srtf,
+round_robin, priority_preemptive and priority_non_preemptive), tie-breaking
+included: those pick the first minimum in input order, so the fuzzer
+shuffles the input and draws arrivals, bursts and priorities from small
+ranges to make ties common. For each seeded random workload both
+implementations run on the same processes and their per-process results
+and Gantt timelines are compared. A failing workload is shrunk to a minimal
+example (fewer processes, then smaller values) before it is reported.
+
+Usage:
+    python fuzz.py [--runs N] [--seed S] [--algorithms FCFS RR ...]
+
+The candidate can be any function with the signature of engine.simulate;
+fuzz() takes it as an argument so new engines can be checked the same way.
+"""
+import argparse
+import copy
+import json
+import random
+import sys
+
+import engine
+import scheduling
+from scheduling import ALGORITHMS
+
+# Result fields both implementations report for every process
+RESULT_FIELDS = ('arrival', 'burst', 'start', 'completion', 'turnaround', 'waiting')
+
+
+def generate(rng, max_processes=8, max_arrival=10, max_burst=8, max_priority=3):
+    """Random single-burst workload with pids 1..n in shuffled input order"""
+    n = rng.randint(1, max_processes)
+    processes = []
+    for pid in range(1, n + 1):
+        burst = rng.randint(1, max_burst)
+        processes.append({
+            'pid': pid,
+            'arrival': rng.randint(0, max_arrival),
+            'burst': burst,
+            'priority': rng.randint(1, max_priority),
+            'remaining': burst
+        })
+    rng.shuffle(processes)
+    return processes
+
+
+def differences(algorithm, processes, quantum=None, candidate=engine.simulate):
+    """Ways the candidate's schedule differs from the reference (empty if identical)"""
+    reference = scheduling.run_reference(algorithm, copy.deepcopy(processes), quantum)
+    try:
+        optimized = candidate(copy.deepcopy(processes), algorithm, quantum)
+    except Exception as e:
+        return [f"candidate raised {type(e).__name__}: {e}"]
+
+    found = []
+    expected = {r['pid']: r for r in reference['results']}
+    actual = {r['pid']: r for r in optimized['results']}
+    if set(expected) != set(actual):
+        found.append(f"pids {sorted(expected)} != {sorted(actual)}")
+    for pid in sorted(set(expected) & set(actual)):
+        for field in RESULT_FIELDS:
+            if expected[pid][field] != actual[pid][field]:
+                found.append(f"P{pid} {field}: expected {expected[pid][field]}, got {actual[pid][field]}")
+
+    expected_gantt = reference['gantt'].to_list()
+    actual_gantt = optimized['gantt'].to_list()
+    if expected_gantt != actual_gantt:
+        found.append(f"gantt: expected {expected_gantt}, got {actual_gantt}")
+    return found
+
+
+def candidates(processes, quantum):
+    """Smaller variants of a failing case, most aggressive first"""
+    # Drop one process, renumbering the rest 1..n-1 in the same input order
+    if len(processes) > 1:
+        for k in range(len(processes)):
+            rest = [dict(p) for j, p in enumerate(processes) if j != k]
+            order = sorted(range(len(rest)), key=lambda j: rest[j]['pid'])
+            for pid, j in enumerate(order, start=1):
+                rest[j]['pid'] = pid
+            yield rest, quantum
+
+    # Swap neighbours in the input order
+    for k in range(len(processes) - 1):
+        swapped = list(processes)
+        swapped[k], swapped[k + 1] = swapped[k + 1], swapped[k]
+        if [p['pid'] for p in swapped] < [p['pid'] for p in processes]:
+            yield swapped, quantum
+
+    # Shrink one value towards its minimum
+    for k, process in enumerate(processes):
+        for field, low in (('arrival', 0), ('burst', 1), ('priority', 1)):
+            value = process[field]
+            for smaller in sorted({low, value // 2, value - 1}):
+                if low <= smaller < value:
+                    shrunk = list(processes)
+                    shrunk[k] = dict(process, **{field: smaller})
+                    if field == 'burst':
+                        shrunk[k]['remaining'] = smaller
+                    yield shrunk, quantum
+
+    if quantum is not None and quantum > 1:
+        yield processes, quantum - 1
+
+
+def shrink(algorithm, processes, quantum=None, candidate=engine.simulate):
+    """Greedily reduce a failing case until no smaller variant still fails"""
+    progress = True
+    while progress:
+        progress = False
+        for smaller, smaller_quantum in candidates(processes, quantum):
+            if differences(algorithm, smaller, smaller_quantum, candidate):
+                processes, quantum = smaller, smaller_quantum
+                progress = True
+                break
+    return processes, quantum
+
+
+def fuzz(runs=1000, seed=0, algorithms=None, candidate=engine.simulate, max_processes=8):
+    """Check runs random workloads per algorithm; return the shrunk failures
+
+    Each failure is a dict with the algorithm, quantum, minimal processes
+    (in input order) and the differences found on them.
+    """
+    if algorithms is None:
+        algorithms = [value for _, value in ALGORITHMS]
+    rng = random.Random(seed)
+    failures = []
+    for algorithm in algorithms:
+        for _ in range(runs):
+            processes = generate(rng, max_processes)
+            quantum = rng.randint(1, 4) if algorithm == "RR" else None
+            if differences(algorithm, processes, quantum, candidate):
+                processes, quantum = shrink(algorithm, processes, quantum, candidate)
+                failures.append({
+                    'algorithm': algorithm,
+                    'quantum': quantum,
+                    'processes': [{field: p[field] for field in ('pid', 'arrival', 'burst', 'priority')}
+                                  for p in processes],
+                    'differences': differences(algorithm, processes, quantum, candidate)
+                })
+                break   # one minimal example per algorithm
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=1000, help="workloads per algorithm")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--algorithms', nargs='+', choices=[value for _, value in ALGORITHMS])
+    parser.add_argument('--max-processes', type=int, default=8)
+    args = parser.parse_args()
+
+    failures = fuzz(args.runs, args.seed, args.algorithms, max_processes=args.max_processes)
+    for failure in failures:
+        print(json.dumps(failure, indent=2))
+    checked = len(args.algorithms or ALGORITHMS)
+    print(f"{checked - len(failures)}/{checked} algorithms match the reference "
+          f"on {args.runs} workloads each (seed {args.seed})")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
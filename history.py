@@ -0,0 +1,371 @@
+"""Persistent run history in a local SQLite database.
+
+Every run is one row of ``runs`` holding its algorithm, quantum, seed, a
+hash of the workload and summary metrics (indexed, so past runs can be
+listed by algorithm, workload or metric), plus the Gantt timeline and
+event deltas as compact blobs. Per-process results are stored column-wise
+in ``run_results``, one array per result field, which keeps
+saving and reloading a million-process run to a handful of rows:
+
+    with RunHistory() as history:
+        run_id = history.save(results, "SRTF")
+        history.list_runs(algorithm="SRTF", order_by="avg_waiting")
+        run = history.load(run_id)      # same shape as engine.simulate()
+
+Blobs hold raw arrays (the narrowest of 1, 4 or 8-byte ints, or doubles),
+with JSON as the fallback for columns holding anything else. A blob is
+zlib-compressed only when a sample of it compresses to under a quarter of
+its size, so mostly constant columns shrink while the rest skip the
+compressor, which would otherwise dominate the time of a save.
+"""
+import array
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import sys
+import time
+import zlib
+from itertools import islice
+from operator import gt, itemgetter
+
+from timeline import GanttTimeline
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.os_process_calculator', 'history.db')
+
+# Process fields that describe the workload rather than the schedule
+WORKLOAD_FIELDS = ('pid', 'arrival', 'burst', 'bursts', 'io', 'priority', 'tickets', 'period', 'deadline')
+
+# Bytes of a blob test-compressed to decide whether compressing it pays off
+SAMPLE_SIZE = 1 << 16
+
+# Blob formats: a tag byte, then the packed columns. Blobs written before the
+# tags existed are plain zlib streams, which start with 0x78 ('x').
+RAW = b'r'
+COMPRESSED = b'z'
+
+# Columns list_runs can sort by (all indexed)
+ORDER_COLUMNS = ('created', 'avg_turnaround', 'avg_waiting', 'makespan', 'cpu_utilization')
+
+SUMMARY_COLUMNS = ('id', 'created', 'algorithm', 'label', 'quantum', 'seed', 'workload',
+                   'processes', 'avg_turnaround', 'avg_waiting', 'makespan', 'cpu_utilization')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    algorithm TEXT NOT NULL,
+    label TEXT,
+    quantum REAL,
+    seed INTEGER,
+    workload TEXT NOT NULL,
+    processes INTEGER NOT NULL,
+    avg_turnaround REAL,
+    avg_waiting REAL,
+    makespan REAL,
+    cpu_utilization REAL,
+    metrics TEXT,
+    analysis TEXT,
+    gantt BLOB NOT NULL,
+    deltas BLOB
+);
+CREATE TABLE IF NOT EXISTS run_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (run_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_algorithm ON runs(algorithm, created);
+CREATE INDEX IF NOT EXISTS runs_workload ON runs(workload, created);
+CREATE INDEX IF NOT EXISTS runs_created ON runs(created);
+CREATE INDEX IF NOT EXISTS runs_avg_turnaround ON runs(avg_turnaround);
+CREATE INDEX IF NOT EXISTS runs_avg_waiting ON runs(avg_waiting);
+CREATE INDEX IF NOT EXISTS runs_makespan ON runs(makespan);
+CREATE INDEX IF NOT EXISTS runs_cpu_utilization ON runs(cpu_utilization);
+"""
+
+
+def field_columns(rows, names=None):
+    """Arrays of the given fields (all fields by default) of a list of dicts, keyed by name
+
+    Rows normally share one schema, so the keys of the first row are taken
+    and each column is built with one pass over the rows. Rows of differing
+    schemas fall back to every field of any row, missing ones as None.
+    """
+    if not rows:
+        return {}
+    if len(set(map(len, rows))) == 1:
+        try:
+            return {name: column_array(list(map(itemgetter(name), rows))) for name in names or rows[0]}
+        except KeyError:
+            pass
+    if names is None:
+        names = {}
+        for keys in set(map(tuple, rows)):
+            names.update(dict.fromkeys(keys))
+    return {name: column_array([row.get(name) for row in rows]) for name in names}
+
+
+def column_array(values):
+    """The narrowest array holding values (1, 4 or 8-byte ints, or doubles), else a list"""
+    for typecode in ('b', 'i', 'q', 'd'):
+        try:
+            return array.array(typecode, values)
+        except (TypeError, OverflowError):
+            continue
+    return list(values)
+
+
+def encode_column(values):
+    """Encode a sequence as (typecode, bytes) using the narrowest array type that holds it
+
+    Integers use 1, 4 or 8 bytes, other numbers doubles; anything else
+    (None, lists, strings) falls back to JSON ('j'). Arrays are taken as
+    they are, so pass them through column_array first if they may be wider
+    than needed.
+    """
+    column = values if isinstance(values, array.array) else column_array(values)
+    if not isinstance(column, array.array):
+        return 'j', json.dumps(column).encode()
+    if sys.byteorder == 'big':
+        column = array.array(column.typecode, column)
+        column.byteswap()
+    return column.typecode, column.tobytes()
+
+
+def decode_column(typecode, data):
+    """Inverse of encode_column"""
+    if typecode == 'j':
+        return json.loads(bytes(data))
+    column = array.array(typecode)
+    column.frombytes(data)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column.tolist()
+
+
+def pack(columns):
+    """Encode a list of equal-length columns into one blob, compressed if that pays off"""
+    header = [struct.pack('<I', len(columns))]
+    body = []
+    for values in columns:
+        typecode, data = encode_column(values)
+        header.append(struct.pack('<cQ', typecode.encode(), len(data)))
+        body.append(data)
+    data = b''.join(header + body)
+    sample = data[:SAMPLE_SIZE]
+    if len(zlib.compress(sample, 1)) * 4 < len(sample):
+        return COMPRESSED + zlib.compress(data, 1)
+    return RAW + data
+
+
+def unpack(blob):
+    """Inverse of pack"""
+    tag = blob[:1]
+    if tag == RAW:
+        data = memoryview(blob)[1:]
+    elif tag == COMPRESSED:
+        data = zlib.decompress(memoryview(blob)[1:])
+    else:
+        data = zlib.decompress(blob)
+    (count,) = struct.unpack_from('<I', data)
+    offset = 4 + count * 9
+    columns = []
+    for k in range(count):
+        typecode, length = struct.unpack_from('<cQ', data, 4 + k * 9)
+        columns.append(decode_column(typecode.decode(), data[offset:offset + length]))
+        offset += length
+    return columns
+
+
+def hash_columns(columns):
+    """SHA-256 over the workload fields present in a dict of columns
+
+    Columns are lists or arrays from column_array (a wider array would
+    hash differently from the same values in a list).
+    """
+    digest = hashlib.sha256()
+    for name in WORKLOAD_FIELDS:
+        if name in columns:
+            typecode, data = encode_column(columns[name])
+            digest.update(f"{name}:{typecode}:".encode())
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def workload_hash(processes):
+    """Identify a workload by its process fields, independent of input order"""
+    pids = list(map(itemgetter('pid'), processes))
+    if any(map(gt, pids, islice(pids, 1, None))):
+        processes = sorted(processes, key=itemgetter('pid'))
+    names = [name for name in WORKLOAD_FIELDS if processes and name in processes[0]]
+    return hash_columns(field_columns(processes, names))
+
+
+def save_run(run, algorithm, quantum=None, seed=None, label=None, processes=None,
+             workload=None, path=DEFAULT_PATH):
+    """Store a run through a connection of its own and return its id
+
+    Safe to call from a background thread or a worker process. With
+    processes, the workload hash is taken from them.
+    """
+    if processes is not None:
+        workload = workload_hash(processes)
+    with RunHistory(path) as store:
+        return store.save(run, algorithm, quantum, seed, label, workload)
+
+
+def load_run(run_id, path=DEFAULT_PATH):
+    """Rebuild a stored run through a connection of its own (see RunHistory.load)"""
+    with RunHistory(path) as store:
+        return store.load(run_id)
+
+
+class RunHistory:
+    """SQLite store of past runs (WAL journal, one transaction per save)"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def save(self, run, algorithm, quantum=None, seed=None, label=None, workload=None):
+        """Store a finished run (the dict returned by an algorithm) and return its id
+
+        workload is the workload_hash of the input processes; without it the
+        hash is taken over the input fields reported in the results. Runs
+        from the engine carry their results column-wise as well ('columns'),
+        which are stored without reading the result dicts.
+        """
+        columns = run.get('columns')
+        if columns is not None:
+            by_name = {name: column_array(values) for name, values in columns.items()}
+            count = len(run['results'])
+        else:
+            rows = [r for r in run['results'] if r is not None]
+            by_name = field_columns(rows)
+            count = len(rows)
+
+        if workload is None:
+            workload = hash_columns(by_name)
+
+        makespan = max(by_name['completion']) if count else 0
+        metrics = run.get('metrics') or {}
+        gantt = run['gantt']
+        if 'cpu_utilization' in metrics:
+            cpu_utilization = metrics['cpu_utilization']
+        else:
+            cpu_utilization = gantt.busy_time() / makespan if makespan else 0
+
+        # Deltas can be rederived from results and Gantt (timeseries.deltas_from_schedule)
+        # unless processes blocked on I/O or ran as periodic jobs
+        deltas = run.get('deltas')
+        deltas_blob = None
+        if deltas is not None and ('period' in by_name or any(by_name.get('io', ()))):
+            ready = deltas['ready']
+            deltas_blob = pack([list(map(itemgetter(0), ready)), list(map(itemgetter(1), ready)),
+                                deltas['completed']])
+
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (created, algorithm, label, quantum, seed, workload, processes, "
+                "avg_turnaround, avg_waiting, makespan, cpu_utilization, metrics, analysis, gantt, deltas) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    time.time(), algorithm, label, quantum, seed, workload, count,
+                    sum(by_name['turnaround']) / count if count else None,
+                    sum(by_name['waiting']) / count if count else None,
+                    makespan, cpu_utilization,
+                    json.dumps(metrics), json.dumps(run.get('analysis')),
+                    pack([gantt.pids, gantt.starts, gantt.ends]), deltas_blob
+                )
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO run_results (run_id, position, name, data) VALUES (?, ?, ?, ?)",
+                [(run_id, position, name, pack([values]))
+                 for position, (name, values) in enumerate(by_name.items())]
+            )
+        return run_id
+
+    def list_runs(self, algorithm=None, workload=None, order_by='created', descending=True, limit=200):
+        """Summaries of stored runs, filtered by algorithm and/or workload hash"""
+        if order_by not in ORDER_COLUMNS:
+            raise ValueError(f"Cannot order runs by {order_by}")
+        conditions = []
+        parameters = []
+        if algorithm is not None:
+            conditions.append("algorithm = ?")
+            parameters.append(algorithm)
+        if workload is not None:
+            conditions.append("workload = ?")
+            parameters.append(workload)
+
+        query = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM runs"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, id DESC LIMIT ?"
+        parameters.append(limit)
+        return [dict(zip(SUMMARY_COLUMNS, row)) for row in self.connection.execute(query, parameters)]
+
+    def algorithms(self):
+        """Distinct algorithms with stored runs"""
+        return [row[0] for row in self.connection.execute(
+            "SELECT DISTINCT algorithm FROM runs ORDER BY algorithm"
+        )]
+
+    def load(self, run_id):
+        """Rebuild a stored run: results, gantt, metrics, analysis and deltas"""
+        row = self.connection.execute(
+            f"SELECT {', '.join(SUMMARY_COLUMNS)}, metrics, analysis, gantt, deltas FROM runs WHERE id = ?",
+            (run_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"No stored run with id {run_id}")
+        summary = dict(zip(SUMMARY_COLUMNS, row))
+        metrics, analysis, gantt_blob, deltas_blob = row[len(SUMMARY_COLUMNS):]
+
+        names = []
+        columns = []
+        for name, data in self.connection.execute(
+            "SELECT name, data FROM run_results WHERE run_id = ? ORDER BY position", (run_id,)
+        ):
+            names.append(name)
+            columns.append(unpack(data)[0])
+        results = [dict(zip(names, values)) for values in zip(*columns)]
+
+        gantt = GanttTimeline.from_columns(*unpack(gantt_blob))
+
+        deltas = None
+        if deltas_blob is not None:
+            times, changes, completed = unpack(deltas_blob)
+            deltas = {'ready': list(zip(times, changes)), 'completed': completed}
+
+        return dict(
+            summary,
+            results=results,
+            gantt=gantt,
+            metrics=json.loads(metrics) or None,
+            analysis=json.loads(analysis),
+            deltas=deltas
+        )
+
+    def delete(self, run_id):
+        """Remove a stored run and its results"""
+        with self.connection:
+            self.connection.execute("DELETE FROM runs WHERE id = ?", (run_id,))
@@ -1,11 +1,43 @@
+import sys
+
+# The headless batch mode is dispatched before tkinter is imported so that it
+# also runs on servers without Tk. batch.py runs as __main__, so the worker
+# processes it spawns re-import batch.py rather than this file.
+if __name__ == "__main__" and any(arg.split('=')[0] == '--watch' for arg in sys.argv[1:]):
+    import runpy
+    runpy.run_module('batch', run_name='__main__', alter_sys=True)
+
 import tkinter as tk
 from tkinter import messagebox, ttk
 import tkinter.font as tkFont
-from collections import deque
 import copy
+import os
+import time
+
+import cluster
+import policies
+import realtime
+import scheduling
+import traces
+from scheduling import ALGORITHMS, REALTIME_ALGORITHMS
+from timeseries import TimeSeries
+
+# Heavier modules (process pools, NumPy, SQLite, ...) are imported inside the
+# methods that first need them so the window can appear as early as possible.
+
+# Input columns for per-process policy fields: header and default for row i
+FIELD_COLUMNS = {
+    'priority': ("Priority", lambda i: i + 1),
+    'tickets': ("Tickets", lambda i: (i + 1) * 10)
+}
+
+PROCESS_COLORS = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6',
+                  '#1abc9c', '#d35400', '#34495e', '#16a085', '#c0392b']
 
 class OSProcessCalculator:
-    def __init__(self):
+    def __init__(self, mainloop=True):
+        self.startup_times = {'start': time.perf_counter()}
+        
         self.root = tk.Tk()
         self.root.title("OS Process Management Calculator")
         self.root.geometry("1200x800")
@@ -21,10 +53,42 @@ class OSProcessCalculator:
         self.results = []
         self.current_algorithm = tk.StringVar(value="FCFS")
         self.time_quantum = tk.StringVar(value="2")
+        self.seed = tk.StringVar(value="1")
         self.num_processes = tk.StringVar(value="3")
+        self.cluster_nodes = tk.StringVar(value="3")
+        self.dispatcher = tk.StringVar(value="round_robin")
+        self.latency = tk.StringVar(value="0")
+        
+        # Worker pool for "Compare All", created on first use
+        self.executor = None
+        self.comparison_futures = {}
+        self.trace_future = None
+        self.cluster_futures = None
+        
+        # Run history database, opened on first use; runs are written by a
+        # background thread (or the worker that produced them)
+        self.history = None
+        self.history_saver = None
+        self.history_load = None
+        self.history_window = None
+        self.history_order = ('created', True)
+        
+        # Results notebook and its tab widgets are built lazily and reused
+        self.results_notebook = None
+        self.tab_widgets = {}
+        self.rendered_tabs = set()
+        self.current_run = None
         
         self.create_main_interface()
-        self.root.mainloop()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Paint the window shell now and build the panels once the loop is idle
+        self.root.update()
+        self.startup_times['shell'] = time.perf_counter()
+        self.root.after_idle(self.create_panels)
+        
+        if mainloop:
+            self.root.mainloop()
     
     def setup_styles(self):
         """Setup consistent styling for the application"""
@@ -42,15 +106,39 @@ class OSProcessCalculator:
             'border': '#404040'        # Border color
         }
         
+        # Only the fonts used by the window shell; see setup_panel_fonts
         self.fonts = {
             'title': tkFont.Font(family="Segoe UI", size=16, weight="bold"),
+            'body': tkFont.Font(family="Segoe UI", size=10)
+        }
+    
+    def setup_panel_fonts(self):
+        """Create the remaining fonts once the window shell is visible"""
+        self.fonts.update({
             'heading': tkFont.Font(family="Segoe UI", size=12, weight="bold"),
-            'body': tkFont.Font(family="Segoe UI", size=10),
             'small': tkFont.Font(family="Segoe UI", size=9)
-        }
+        })
+    
+    def setup_ttk_styles(self):
+        """Configure ttk styles (loads the ttk theme, so done on first use)"""
+        style = ttk.Style(self.root)
+        style.configure(
+            'Results.Treeview',
+            background=self.colors['dark'],
+            fieldbackground=self.colors['dark'],
+            foreground=self.colors['white'],
+            font=self.fonts['body'],
+            rowheight=24
+        )
+        style.configure(
+            'Results.Treeview.Heading',
+            background=self.colors['primary'],
+            foreground=self.colors['white'],
+            font=self.fonts['heading']
+        )
     
     def create_main_interface(self):
-        """Create the main interface layout"""
+        """Create the window shell: header and an empty main container"""
         # Title Header
         self.create_header()
         
@@ -58,11 +146,27 @@ class OSProcessCalculator:
         self.main_container = tk.Frame(self.root, bg='#000000')  # Changed to black
         self.main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
+        self.loading_label = tk.Label(
+            self.main_container,
+            text="Loading...",
+            font=self.fonts['body'],
+            fg=self.colors['gray'],
+            bg='#000000'
+        )
+        self.loading_label.pack(expand=True)
+    
+    def create_panels(self):
+        """Create the configuration and results panels (deferred from startup)"""
+        self.setup_panel_fonts()
+        self.loading_label.destroy()
+        
         # Configuration Panel (Left Side)
         self.create_config_panel()
         
         # Results Panel (Right Side)
         self.create_results_panel()
+        
+        self.startup_times['ready'] = time.perf_counter()
     
     def create_header(self):
         """Create application header"""
@@ -123,16 +227,8 @@ class OSProcessCalculator:
         )
         algo_frame.pack(fill=tk.X, padx=15, pady=(15, 10))
         
-        algorithms = [
-            ("First Come First Serve (FCFS)", "FCFS"),
-            ("Shortest Job First (SJF)", "SJF"),
-            ("Shortest Remaining Time First (SRTF)", "SRTF"),
-            ("Round Robin (RR)", "RR"),
-            ("Priority (Preemptive)", "Priority_Preemptive"),
-            ("Priority (Non-Preemptive)", "Priority_NonPreemptive")
-        ]
-        
-        for text, value in algorithms:
+        registered = [(policy.label or name, name) for name, policy in policies.POLICIES.items()]
+        for text, value in registered + REALTIME_ALGORITHMS:
             rb = tk.Radiobutton(
                 algo_frame,
                 text=text,
@@ -148,7 +244,7 @@ class OSProcessCalculator:
             )
             rb.pack(anchor=tk.W, pady=5)  # Increased padding
         
-        # Time Quantum for Round Robin
+        # Time Quantum for Round Robin and proportional-share policies
         self.quantum_frame = tk.Frame(algo_frame, bg=self.colors['white'])
         self.quantum_frame.pack(fill=tk.X, pady=(10, 0))
         
@@ -168,6 +264,23 @@ class OSProcessCalculator:
         self.quantum_entry.pack(side=tk.LEFT, padx=(10, 0))
         
         self.quantum_frame.pack_forget()  # Initially hidden
+        
+        # Random seed for Lottery
+        self.seed_frame = tk.Frame(algo_frame, bg=self.colors['white'])
+        
+        tk.Label(
+            self.seed_frame,
+            text="Seed:",
+            font=self.fonts['body'],
+            bg=self.colors['white']
+        ).pack(side=tk.LEFT)
+        
+        tk.Entry(
+            self.seed_frame,
+            textvariable=self.seed,
+            width=10,
+            font=self.fonts['body']
+        ).pack(side=tk.LEFT, padx=(10, 0))
     
     def create_process_config_section(self, parent):
         """Create process configuration section"""
@@ -208,6 +321,34 @@ class OSProcessCalculator:
         )
         num_spinbox.pack(side=tk.LEFT, padx=(10, 0))
         
+        # Cluster mode: nodes running the selected policy behind a dispatcher
+        cluster_frame = tk.Frame(config_frame, bg=self.colors['dark'])
+        cluster_frame.pack(fill=tk.X, pady=5)
+        
+        for text, variable, width in (("Nodes:", self.cluster_nodes, 4), ("Latency:", self.latency, 4)):
+            tk.Label(
+                cluster_frame,
+                text=text,
+                font=self.fonts['body'],
+                fg=self.colors['white'],
+                bg=self.colors['dark']
+            ).pack(side=tk.LEFT, padx=(0, 5))
+            
+            tk.Entry(
+                cluster_frame,
+                textvariable=variable,
+                width=width,
+                font=self.fonts['body']
+            ).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Combobox(
+            cluster_frame,
+            textvariable=self.dispatcher,
+            values=cluster.DISPATCHERS,
+            state='readonly',
+            width=13
+        ).pack(side=tk.LEFT)
+        
         # Generate button with improved styling
         generate_btn = tk.Button(
             config_frame,
@@ -224,6 +365,40 @@ class OSProcessCalculator:
             relief=tk.FLAT
         )
         generate_btn.pack(pady=(10, 0))
+        
+        # Replay a recorded scheduler trace instead of hand-entered processes
+        trace_btn = tk.Button(
+            config_frame,
+            text="Import Trace...",
+            command=self.import_trace,
+            font=self.fonts['body'],
+            bg=self.colors['secondary'],
+            fg=self.colors['dark'],
+            activebackground=self.colors['highlight'],
+            activeforeground=self.colors['white'],
+            padx=20,
+            pady=5,
+            cursor='hand2',
+            relief=tk.FLAT
+        )
+        trace_btn.pack(pady=(10, 0))
+        
+        # Browse and reload runs saved in the history database
+        history_btn = tk.Button(
+            config_frame,
+            text="History...",
+            command=self.show_history,
+            font=self.fonts['body'],
+            bg=self.colors['secondary'],
+            fg=self.colors['dark'],
+            activebackground=self.colors['highlight'],
+            activeforeground=self.colors['white'],
+            padx=20,
+            pady=5,
+            cursor='hand2',
+            relief=tk.FLAT
+        )
+        history_btn.pack(pady=(10, 0))
     
     def create_process_input_section(self, parent):
         """Create process input section"""
@@ -289,10 +464,25 @@ class OSProcessCalculator:
     
     def on_algorithm_change(self):
         """Handle algorithm selection change"""
-        if self.current_algorithm.get() == "RR":
+        if scheduling.uses_quantum(self.current_algorithm.get()):
             self.quantum_frame.pack(fill=tk.X, pady=(10, 0))
         else:
             self.quantum_frame.pack_forget()
+        
+        if scheduling.uses_seed(self.current_algorithm.get()):
+            self.seed_frame.pack(fill=tk.X, pady=(10, 0))
+        else:
+            self.seed_frame.pack_forget()
+    
+    def on_close(self):
+        """Stop comparison workers and close the window"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.history_saver is not None:
+            self.history_saver.shutdown(wait=True)
+        if self.history is not None:
+            self.history.close()
+        self.root.destroy()
     
     def generate_process_table(self):
         """Generate process input table"""
@@ -310,8 +500,9 @@ class OSProcessCalculator:
         
         # Create table headers
         headers = ["Process", "Arrival Time", "Burst Time"]
-        if "Priority" in self.current_algorithm.get():
-            headers.append("Priority")
+        extra_columns = self.get_extra_columns(num_proc)
+        headers.extend(header for header, _, _ in extra_columns)
+        self.entry_columns = ['arrival', 'burst'] + [key for _, key, _ in extra_columns]
         
         # Create header row
         header_frame = tk.Frame(self.input_frame, bg=self.colors['light'])
@@ -382,9 +573,9 @@ class OSProcessCalculator:
             
             entries = [at_entry, bt_entry]
             
-            # Priority (if needed)
-            if "Priority" in self.current_algorithm.get():
-                priority_entry = tk.Entry(
+            # Priority or period/deadline (if needed)
+            for col, (_, _, default) in enumerate(extra_columns, start=3):
+                extra_entry = tk.Entry(
                     row_frame,
                     font=self.fonts['body'],
                     bg=self.colors['dark'],
@@ -396,15 +587,19 @@ class OSProcessCalculator:
                     width=12,
                     justify='center'
                 )
-                priority_entry.grid(row=0, column=3, padx=1, pady=1, sticky="ew")  # Fixed parenthesis
-                priority_entry.insert(0, str(i+1))
-                entries.append(priority_entry)
+                extra_entry.grid(row=0, column=col, padx=1, pady=1, sticky="ew")
+                extra_entry.insert(0, str(default(i)))
+                entries.append(extra_entry)
             
             self.process_entries.append(entries)
         
+        # Action buttons
+        button_frame = tk.Frame(self.input_frame, bg=self.colors['dark'])
+        button_frame.pack(pady=(20, 0))
+        
         # Calculate button
         calc_btn = tk.Button(
-            self.input_frame,
+            button_frame,
             text="Calculate Results",
             command=self.calculate_results,
             font=self.fonts['heading'],
@@ -417,474 +612,674 @@ class OSProcessCalculator:
             cursor='hand2',
             relief=tk.FLAT
         )
-        calc_btn.pack(pady=(20, 0))
+        calc_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Compare all algorithms button
+        compare_btn = tk.Button(
+            button_frame,
+            text="Compare All",
+            command=self.compare_all,
+            font=self.fonts['heading'],
+            bg=self.colors['secondary'],
+            fg=self.colors['dark'],
+            activebackground=self.colors['highlight'],
+            activeforeground=self.colors['white'],
+            padx=30,
+            pady=10,
+            cursor='hand2',
+            relief=tk.FLAT
+        )
+        compare_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Simulate the selected policy on every node of a cluster
+        cluster_btn = tk.Button(
+            button_frame,
+            text="Simulate Cluster",
+            command=self.simulate_cluster,
+            font=self.fonts['heading'],
+            bg=self.colors['secondary'],
+            fg=self.colors['dark'],
+            activebackground=self.colors['highlight'],
+            activeforeground=self.colors['white'],
+            padx=30,
+            pady=10,
+            cursor='hand2',
+            relief=tk.FLAT
+        )
+        cluster_btn.pack(side=tk.LEFT, padx=5)
+    
+    def get_extra_columns(self, num_proc):
+        """Algorithm-specific input columns as (header, key, default for row i)"""
+        algorithm = self.current_algorithm.get()
+        if algorithm in policies.POLICIES:
+            columns = []
+            for field in policies.POLICIES[algorithm].fields:
+                header, default = FIELD_COLUMNS.get(field, (field.title(), lambda i: 1))
+                columns.append((header, field, default))
+            return columns
+        if algorithm in realtime.ALGORITHMS:
+            # Default periods keep the default task set schedulable
+            period = lambda i: (i + 1) * 2 * (num_proc + 1)
+            return [("Period", 'period', period), ("Deadline", 'deadline', period)]
+        return []
+    
+    def collect_processes(self):
+        """Validate and collect process data from the input table"""
+        processes = []
+        for i, entries in enumerate(self.process_entries):
+            values = dict(zip(self.entry_columns, entries))
+            arrival = int(entries[0].get())
+            # "5" is a single CPU burst, "5,3,4" alternates CPU and I/O bursts
+            bursts = [int(value) for value in entries[1].get().split(',')]
+            burst = sum(bursts[0::2])
+            
+            if arrival < 0 or any(b <= 0 for b in bursts) or len(bursts) % 2 == 0:
+                raise ValueError(f"Invalid values for Process P{i+1}")
+            
+            priority = 0
+            if 'priority' in values:  # Priority included
+                priority = int(values['priority'].get())
+            
+            process = {
+                'pid': i + 1,
+                'arrival': arrival,
+                'burst': burst,
+                'bursts': bursts,
+                'priority': priority,
+                'remaining': burst
+            }
+            
+            if 'tickets' in values:  # Proportional-share tickets
+                process['tickets'] = int(values['tickets'].get())
+                if process['tickets'] <= 0:
+                    raise ValueError(f"Invalid tickets for Process P{i+1}")
+            
+            for field, entry in values.items():  # Fields of custom policies
+                if field not in process and field not in ('period', 'deadline'):
+                    process[field] = int(entry.get())
+            
+            if 'period' in values:  # Periodic real-time task
+                process['period'] = int(values['period'].get())
+                process['deadline'] = int(values['deadline'].get())
+                if process['period'] <= 0 or process['deadline'] <= 0 or len(bursts) > 1:
+                    raise ValueError(f"Invalid period or deadline for Process P{i+1}")
+            
+            processes.append(process)
+        
+        return processes
+    
+    def get_quantum(self):
+        """Validate and return the Round Robin time quantum"""
+        quantum = int(self.time_quantum.get())
+        if quantum <= 0:
+            raise ValueError("Time quantum must be positive")
+        return quantum
+    
+    def get_seed(self):
+        """Validate and return the random seed for Lottery"""
+        return int(self.seed.get())
     
     def calculate_results(self):
         """Calculate and display results"""
         try:
-            # Validate and collect process data
-            processes = []
-            for i, entries in enumerate(self.process_entries):
-                arrival = int(entries[0].get())
-                burst = int(entries[1].get())
-                
-                if arrival < 0 or burst <= 0:
-                    raise ValueError(f"Invalid values for Process P{i+1}")
-                
-                priority = 0
-                if len(entries) > 2:  # Priority included
-                    priority = int(entries[2].get())
-                
-                processes.append({
-                    'pid': i + 1,
-                    'arrival': arrival,
-                    'burst': burst,
-                    'priority': priority,
-                    'remaining': burst
-                })
+            processes = self.collect_processes()
             
             # Execute selected algorithm
             algorithm = self.current_algorithm.get()
-            if algorithm == "FCFS":
-                results = self.fcfs(processes)
-            elif algorithm == "SJF":
-                results = self.sjf(processes)
-            elif algorithm == "SRTF":
-                results = self.srtf(processes)
-            elif algorithm == "RR":
-                quantum = int(self.time_quantum.get())
-                if quantum <= 0:
-                    raise ValueError("Time quantum must be positive")
-                results = self.round_robin(processes, quantum)
-            elif algorithm == "Priority_Preemptive":
-                results = self.priority_preemptive(processes)
-            elif algorithm == "Priority_NonPreemptive":
-                results = self.priority_non_preemptive(processes)
+            quantum = self.get_quantum() if scheduling.uses_quantum(algorithm) else None
+            seed = self.get_seed() if scheduling.uses_seed(algorithm) else None
+            results = scheduling.run_algorithm(algorithm, processes, quantum, seed)
             
             self.display_results(results, algorithm)
-            
+            self.save_run(results, algorithm, quantum, seed, processes=processes)
+        
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
         except Exception as e:
             messagebox.showerror("Error", f"Calculation error: {e}")
     
-    def fcfs(self, processes):
-        """First Come First Serve algorithm"""
-        processes.sort(key=lambda x: x['arrival'])
-        current_time = 0
-        results = []
-        gantt_chart = []
-        
-        for process in processes:
-            start_time = max(current_time, process['arrival'])
-            completion_time = start_time + process['burst']
-            turnaround_time = completion_time - process['arrival']
-            waiting_time = turnaround_time - process['burst']
-            
-            results.append({
-                'pid': process['pid'],
-                'arrival': process['arrival'],
-                'burst': process['burst'],
-                'start': start_time,
-                'completion': completion_time,
-                'turnaround': turnaround_time,
-                'waiting': waiting_time
-            })
-            
-            gantt_chart.append({
-                'pid': process['pid'],
-                'start': start_time,
-                'end': completion_time
-            })
-            
-            current_time = completion_time
+    def import_trace(self):
+        """Replay a recorded scheduler trace through the selected algorithm"""
+        from tkinter import filedialog
+        
+        algorithm = self.current_algorithm.get()
+        try:
+            traces.check_algorithm(algorithm)
+            quantum = self.get_quantum() if scheduling.uses_quantum(algorithm) else None
+            seed = self.get_seed() if scheduling.uses_seed(algorithm) else None
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid input: {e}")
+            return
+        
+        path = filedialog.askopenfilename(
+            title="Import Scheduler Trace",
+            filetypes=[("Trace files", "*.txt *.log *.gz"), ("All files", "*")]
+        )
+        if not path:
+            return
         
-        return {'results': results, 'gantt': gantt_chart}
+        # Parsing, simulation and saving run in a worker so large traces keep the window responsive
+        title = f"{algorithm} ({os.path.basename(path)})"
+        self.trace_future = self.get_executor().submit(self.run_trace, path, algorithm, quantum, seed, title)
+        
+        self.clear_results_content()
+        tk.Label(
+            self.results_content,
+            text=f"Replaying {os.path.basename(path)}...",
+            font=self.fonts['body'],
+            fg=self.colors['white'],
+            bg=self.colors['dark']
+        ).pack(expand=True)
+        
+        self.root.after(100, self.poll_trace, self.trace_future, title)
     
-    def sjf(self, processes):
-        """Shortest Job First (Non-preemptive) algorithm"""
-        n = len(processes)
-        completed = 0
-        current_time = 0
-        results = []
-        gantt_chart = []
-        processes_copy = copy.deepcopy(processes)
+    @staticmethod
+    def run_trace(path, algorithm, quantum=None, seed=None, label=None):
+        """Stream a scheduler trace through the event engine and save the run to the history"""
+        import history
+        
+        run = traces.replay_trace(path, algorithm, quantum, seed)
+        if not run['results']:
+            raise ValueError("No scheduler events found in trace")
+        workload = history.hash_columns({name: history.column_array(column)
+                                         for name, column in run.pop('workload').items()})
+        try:
+            history.save_run(run, algorithm, quantum, seed, label, workload=workload)
+        except Exception as e:
+            run['save_error'] = str(e)
+        del run['columns']  # only needed for saving; not worth sending back
+        return run
+    
+    def poll_trace(self, future, title):
+        """Show the trace replay once the worker has finished"""
+        if future is not self.trace_future:
+            return  # Superseded by a newer import
+        if not future.done():
+            self.root.after(100, self.poll_trace, future, title)
+            return
         
-        while completed != n:
-            available = [p for p in processes_copy if p['arrival'] <= current_time and p['remaining'] > 0]
-            
-            if not available:
-                current_time += 1
-                continue
-            
-            # Select process with shortest burst time
-            selected = min(available, key=lambda x: x['burst'])
-            
-            start_time = current_time
-            completion_time = current_time + selected['burst']
-            turnaround_time = completion_time - selected['arrival']
-            waiting_time = turnaround_time - selected['burst']
-            
-            results.append({
-                'pid': selected['pid'],
-                'arrival': selected['arrival'],
-                'burst': selected['burst'],
-                'start': start_time,
-                'completion': completion_time,
-                'turnaround': turnaround_time,
-                'waiting': waiting_time
-            })
-            
-            gantt_chart.append({
-                'pid': selected['pid'],
-                'start': start_time,
-                'end': completion_time
-            })
-            
-            selected['remaining'] = 0
-            current_time = completion_time
-            completed += 1
-        
-        return {'results': sorted(results, key=lambda x: x['pid']), 'gantt': gantt_chart}
-    
-    def srtf(self, processes):
-        """Shortest Remaining Time First (Preemptive) algorithm"""
-        n = len(processes)
-        completed = 0
-        current_time = 0
-        results = [None] * n
-        gantt_chart = []
-        processes_copy = copy.deepcopy(processes)
-        last_process = None
-        
-        while completed != n:
-            available = [p for p in processes_copy if p['arrival'] <= current_time and p['remaining'] > 0]
-            
-            if not available:
-                current_time += 1
-                continue
-            
-            # Select process with shortest remaining time
-            selected = min(available, key=lambda x: x['remaining'])
-            
-            # If switching process, record in Gantt chart
-            if last_process != selected['pid']:
-                if last_process is not None:
-                    # Close previous process segment
-                    if gantt_chart and gantt_chart[-1]['pid'] == last_process:
-                        gantt_chart[-1]['end'] = current_time
-                
-                gantt_chart.append({
-                    'pid': selected['pid'],
-                    'start': current_time,
-                    'end': current_time + 1
-                })
-            
-            selected['remaining'] -= 1
-            
-            if selected['remaining'] == 0:
-                completion_time = current_time + 1
-                turnaround_time = completion_time - selected['arrival']
-                waiting_time = turnaround_time - selected['burst']
-                
-                results[selected['pid'] - 1] = {
-                    'pid': selected['pid'],
-                    'arrival': selected['arrival'],
-                    'burst': selected['burst'],
-                    'start': selected['arrival'],  # Will be updated with first start
-                    'completion': completion_time,
-                    'turnaround': turnaround_time,
-                    'waiting': waiting_time
-                }
-                completed += 1
-            
-            last_process = selected['pid']
-            current_time += 1
-        
-        # Close last process segment
-        if gantt_chart:
-            gantt_chart[-1]['end'] = current_time
-        
-        return {'results': results, 'gantt': gantt_chart}
-    
-    def round_robin(self, processes, quantum):
-        """Round Robin algorithm"""
-        n = len(processes)
-        queue = deque()
-        current_time = 0
-        results = [None] * n
-        gantt_chart = []
-        processes_copy = copy.deepcopy(processes)
-        completed = 0
-        
-        # Add processes that arrive at time 0
-        for process in processes_copy:
-            if process['arrival'] == 0:
-                queue.append(process)
-        
-        while completed < n:
-            if not queue:
-                # Find next arriving process
-                next_arrival = min([p['arrival'] for p in processes_copy if p['remaining'] > 0])
-                current_time = next_arrival
-                for process in processes_copy:
-                    if process['arrival'] == current_time and process['remaining'] > 0:
-                        queue.append(process)
-                continue
-            
-            current_process = queue.popleft()
-            
-            if current_process['remaining'] > 0:
-                # Execute for quantum time or remaining time, whichever is smaller
-                execution_time = min(quantum, current_process['remaining'])
-                
-                gantt_chart.append({
-                    'pid': current_process['pid'],
-                    'start': current_time,
-                    'end': current_time + execution_time
-                })
-                
-                current_process['remaining'] -= execution_time
-                current_time += execution_time
-                
-                # Add newly arrived processes to queue
-                for process in processes_copy:
-                    if (process['arrival'] <= current_time and 
-                        process['remaining'] > 0 and 
-                        process not in queue and 
-                        process != current_process):
-                        queue.append(process)
-                
-                if current_process['remaining'] == 0:
-                    # Process completed
-                    completion_time = current_time
-                    turnaround_time = completion_time - current_process['arrival']
-                    waiting_time = turnaround_time - current_process['burst']
-                    
-                    results[current_process['pid'] - 1] = {
-                        'pid': current_process['pid'],
-                        'arrival': current_process['arrival'],
-                        'burst': current_process['burst'],
-                        'start': current_process['arrival'],
-                        'completion': completion_time,
-                        'turnaround': turnaround_time,
-                        'waiting': waiting_time
-                    }
-                    completed += 1
-                else:
-                    # Process not completed, add back to queue
-                    queue.append(current_process)
-        
-        return {'results': results, 'gantt': gantt_chart}
-    
-    def priority_preemptive(self, processes):
-        """Priority Scheduling (Preemptive) algorithm"""
-        n = len(processes)
-        completed = 0
-        current_time = 0
-        results = [None] * n
-        gantt_chart = []
-        processes_copy = copy.deepcopy(processes)
-        last_process = None
-        
-        while completed != n:
-            available = [p for p in processes_copy if p['arrival'] <= current_time and p['remaining'] > 0]
-            
-            if not available:
-                current_time += 1
-                continue
-            
-            # Select process with highest priority (lowest priority number)
-            selected = min(available, key=lambda x: x['priority'])
-            
-            # If switching process, record in Gantt chart
-            if last_process != selected['pid']:
-                if last_process is not None and gantt_chart:
-                    gantt_chart[-1]['end'] = current_time
-                
-                gantt_chart.append({
-                    'pid': selected['pid'],
-                    'start': current_time,
-                    'end': current_time + 1
-                })
-            
-            selected['remaining'] -= 1
-            
-            if selected['remaining'] == 0:
-                completion_time = current_time + 1
-                turnaround_time = completion_time - selected['arrival']
-                waiting_time = turnaround_time - selected['burst']
-                
-                results[selected['pid'] - 1] = {
-                    'pid': selected['pid'],
-                    'arrival': selected['arrival'],
-                    'burst': selected['burst'],
-                    'priority': selected['priority'],
-                    'start': selected['arrival'],
-                    'completion': completion_time,
-                    'turnaround': turnaround_time,
-                    'waiting': waiting_time
-                }
-                completed += 1
+        try:
+            results = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Trace import failed: {e}")
+            return
+        self.display_results(results, title)
+        if 'save_error' in results:
+            messagebox.showwarning("History", f"Run could not be saved: {results['save_error']}")
+        else:
+            self.refresh_open_history()
+    
+    def get_history(self):
+        """Return the run history database, opening it on first use"""
+        if self.history is None:
+            import history
+            self.history = history.RunHistory()
+        return self.history
+    
+    def get_history_saver(self):
+        """Return the background thread for history saves and loads, starting it on first use"""
+        if self.history_saver is None:
+            import concurrent.futures
             
-            last_process = selected['pid']
-            current_time += 1
-        
-        # Close last process segment
-        if gantt_chart:
-            gantt_chart[-1]['end'] = current_time
-        
-        return {'results': results, 'gantt': gantt_chart}
-    
-    def priority_non_preemptive(self, processes):
-        """Priority Scheduling (Non-preemptive) algorithm"""
-        n = len(processes)
-        completed = 0
-        current_time = 0
-        results = []
-        gantt_chart = []
-        processes_copy = copy.deepcopy(processes)
-        
-        while completed != n:
-            available = [p for p in processes_copy if p['arrival'] <= current_time and p['remaining'] > 0]
+            # One thread, so saves are written in order and a load sees every
+            # earlier save; each call opens its own connection
+            self.history_saver = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        return self.history_saver
+    
+    def save_run(self, results, algorithm, quantum=None, seed=None, label=None,
+                 processes=None, workload=None):
+        """Store a displayed run in the history database from a background thread"""
+        import history
+        
+        future = self.get_history_saver().submit(
+            history.save_run, results, algorithm, quantum, seed, label, processes, workload
+        )
+        self.root.after(100, self.poll_save, future)
+    
+    def poll_save(self, future):
+        """Report a finished save and show it in the history window"""
+        if not future.done():
+            self.root.after(100, self.poll_save, future)
+            return
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showwarning("History", f"Run could not be saved: {e}")
+            return
+        self.refresh_open_history()
+    
+    def refresh_open_history(self):
+        """Reload the history window if it is open"""
+        if self.history_window is not None and self.history_window.winfo_exists():
+            self.refresh_history()
+    
+    def show_history(self):
+        """Open the run history window, or raise it if it is already open"""
+        if self.history_window is not None and self.history_window.winfo_exists():
+            self.history_window.lift()
+            return
+        try:
+            self.get_history()
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open run history: {e}")
+            return
+        
+        self.setup_ttk_styles()
+        window = tk.Toplevel(self.root)
+        window.title("Run History")
+        window.geometry("1000x450")
+        window.configure(bg=self.colors['primary'])
+        self.history_window = window
+        
+        # Algorithm filter
+        filter_frame = tk.Frame(window, bg=self.colors['primary'])
+        filter_frame.pack(fill=tk.X, padx=20, pady=(15, 5))
+        tk.Label(
+            filter_frame,
+            text="Algorithm:",
+            font=self.fonts['body'],
+            fg=self.colors['white'],
+            bg=self.colors['primary']
+        ).pack(side=tk.LEFT)
+        algorithm_filter = ttk.Combobox(filter_frame, state='readonly', width=25)
+        algorithm_filter.set("All")
+        algorithm_filter.pack(side=tk.LEFT, padx=10)
+        algorithm_filter.bind("<<ComboboxSelected>>", lambda e: self.refresh_history())
+        
+        # Runs table; sortable columns are indexed in the database
+        columns = [
+            ('ID', None), ('Date', 'created'), ('Algorithm', None), ('Quantum', None),
+            ('Processes', None), ('Avg Turnaround', 'avg_turnaround'),
+            ('Avg Waiting', 'avg_waiting'), ('Makespan', 'makespan'), ('CPU %', 'cpu_utilization')
+        ]
+        table_container = tk.Frame(window, bg=self.colors['primary'])
+        table_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=5)
+        tree = ttk.Treeview(table_container, columns=[c for c, _ in columns],
+                            show='headings', style='Results.Treeview')
+        scrollbar = ttk.Scrollbar(table_container, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        for column, order in columns:
+            if order is None:
+                tree.heading(column, text=column)
+            else:
+                tree.heading(column, text=column, command=lambda o=order: self.sort_history(o))
+            tree.column(column, width=150 if column in ('Date', 'Algorithm') else 90, anchor=tk.CENTER)
+        tree.tag_configure('odd', background=self.colors['light'])
+        tree.tag_configure('even', background=self.colors['dark'])
+        tree.bind('<Double-1>', lambda e: self.load_history_run())
+        
+        button_frame = tk.Frame(window, bg=self.colors['primary'])
+        button_frame.pack(pady=(5, 15))
+        for text, command, color in [("Load", self.load_history_run, 'success'),
+                                     ("Delete", self.delete_history_run, 'danger')]:
+            tk.Button(
+                button_frame,
+                text=text,
+                command=command,
+                font=self.fonts['body'],
+                bg=self.colors[color],
+                fg=self.colors['dark'],
+                activebackground=self.colors['highlight'],
+                activeforeground=self.colors['white'],
+                padx=20,
+                pady=5,
+                cursor='hand2',
+                relief=tk.FLAT
+            ).pack(side=tk.LEFT, padx=10)
+        
+        self.history_widgets = {'filter': algorithm_filter, 'tree': tree}
+        self.refresh_history()
+    
+    def sort_history(self, order_by):
+        """Sort the history table by a metric, toggling direction on repeated clicks"""
+        column, descending = self.history_order
+        self.history_order = (order_by, not descending if column == order_by else True)
+        self.refresh_history()
+    
+    def refresh_history(self):
+        """Reload the runs shown in the history window"""
+        store = self.get_history()
+        algorithm_filter = self.history_widgets['filter']
+        algorithm_filter.configure(values=["All"] + store.algorithms())
+        selected = algorithm_filter.get()
+        
+        order_by, descending = self.history_order
+        runs = store.list_runs(
+            algorithm=None if selected == "All" else selected,
+            order_by=order_by,
+            descending=descending
+        )
+        
+        tree = self.history_widgets['tree']
+        tree.delete(*tree.get_children())
+        for i, run in enumerate(runs):
+            values = [
+                run['id'],
+                time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(run['created'])),
+                run['label'] or run['algorithm'].replace('_', ' '),
+                '' if run['quantum'] is None else f"{run['quantum']:g}",
+                run['processes'],
+                '' if run['avg_turnaround'] is None else f"{run['avg_turnaround']:.2f}",
+                '' if run['avg_waiting'] is None else f"{run['avg_waiting']:.2f}",
+                f"{run['makespan']:g}",
+                f"{run['cpu_utilization'] * 100:.1f}"
+            ]
+            tree.insert('', tk.END, iid=str(run['id']), values=values,
+                        tags=('odd' if i % 2 == 0 else 'even',))
+    
+    def selected_history_run(self):
+        """Id of the run selected in the history window, or None"""
+        selection = self.history_widgets['tree'].selection()
+        return int(selection[0]) if selection else None
+    
+    def load_history_run(self):
+        """Display a stored run without re-simulating it, loading it in the background"""
+        import history
+        
+        run_id = self.selected_history_run()
+        if run_id is None:
+            return
+        self.history_load = self.get_history_saver().submit(history.load_run, run_id)
+        self.root.after(50, self.poll_load, self.history_load, run_id)
+    
+    def poll_load(self, future, run_id):
+        """Display a stored run once the background load has finished"""
+        if future is not self.history_load:
+            return  # Superseded by a newer load
+        if not future.done():
+            self.root.after(50, self.poll_load, future, run_id)
+            return
+        try:
+            run = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not load run {run_id}: {e}")
+            return
+        self.display_results(run, run['label'] or run['algorithm'])
+    
+    def delete_history_run(self):
+        """Remove the selected run from the history database"""
+        run_id = self.selected_history_run()
+        if run_id is None:
+            return
+        if not messagebox.askyesno("Delete Run", f"Delete run {run_id} from the history?",
+                                   parent=self.history_window):
+            return
+        self.get_history().delete(run_id)
+        self.refresh_history()
+    
+    def get_executor(self):
+        """Return the worker pool for comparisons, traces and cluster nodes, creating it on first use"""
+        if self.executor is None:
+            import concurrent.futures
+            import multiprocessing
             
-            if not available:
-                current_time += 1
+            # Spawn keeps the workers independent of the Tk interpreter
+            self.executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(len(ALGORITHMS), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self.executor
+    
+    def compare_all(self):
+        """Run every algorithm on the same workload in parallel worker processes"""
+        try:
+            processes = self.collect_processes()
+            quantum = self.get_quantum()
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid input: {e}")
+            return
+        
+        # Abandon a comparison that is still running
+        for future in self.comparison_futures:
+            future.cancel()
+        
+        executor = self.get_executor()
+        self.comparison_futures = {
+            executor.submit(scheduling.run_algorithm, value, copy.deepcopy(processes), quantum): value
+            for _, value in ALGORITHMS
+        }
+        self.comparison_results = {}
+        
+        self.create_comparison_view()
+        self.root.after(50, self.poll_comparison, self.comparison_futures)
+    
+    def poll_comparison(self, futures):
+        """Collect finished comparison runs and schedule the next check"""
+        if futures is not self.comparison_futures:
+            return  # Superseded by a newer comparison
+        
+        for future, algorithm in futures.items():
+            if algorithm in self.comparison_results or not future.done():
                 continue
-            
-            # Select process with highest priority (lowest priority number)
-            selected = min(available, key=lambda x: x['priority'])
-            
-            start_time = current_time
-            completion_time = current_time + selected['burst']
-            turnaround_time = completion_time - selected['arrival']
-            waiting_time = turnaround_time - selected['burst']
-            
-            results.append({
-                'pid': selected['pid'],
-                'arrival': selected['arrival'],
-                'burst': selected['burst'],
-                'priority': selected['priority'],
-                'start': start_time,
-                'completion': completion_time,
-                'turnaround': turnaround_time,
-                'waiting': waiting_time
-            })
-            
-            gantt_chart.append({
-                'pid': selected['pid'],
-                'start': start_time,
-                'end': completion_time
-            })
-            
-            selected['remaining'] = 0
-            current_time = completion_time
-            completed += 1
+            try:
+                self.comparison_results[algorithm] = future.result()
+            except Exception as e:
+                self.comparison_results[algorithm] = e
+            self.update_comparison_view(algorithm)
+        
+        if len(self.comparison_results) < len(futures):
+            self.root.after(50, self.poll_comparison, futures)
+    
+    def get_cluster_settings(self):
+        """Validate and return the number of nodes, dispatcher and dispatch latency"""
+        nodes = int(self.cluster_nodes.get())
+        if nodes <= 0:
+            raise ValueError("Number of nodes must be positive")
+        latency = int(self.latency.get())
+        if latency < 0:
+            raise ValueError("Dispatch latency must not be negative")
+        return nodes, self.dispatcher.get(), latency
+    
+    def simulate_cluster(self):
+        """Dispatch the workload across cluster nodes in worker processes"""
+        algorithm = self.current_algorithm.get()
+        try:
+            if algorithm not in policies.POLICIES:
+                raise ValueError(f"{algorithm} cannot run on cluster nodes")
+            processes = self.collect_processes()
+            quantum = self.get_quantum() if scheduling.uses_quantum(algorithm) else None
+            seed = self.get_seed() if scheduling.uses_seed(algorithm) else None
+            nodes, dispatcher, latency = self.get_cluster_settings()
+            plan = cluster.plan(processes, nodes, algorithm, dispatcher, latency, quantum, seed)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid input: {e}")
+            return
         
-        return {'results': sorted(results, key=lambda x: x['pid']), 'gantt': gantt_chart}
+        executor = self.get_executor()
+        if plan['assignment'] is not None:
+            # Partitioned jobs: every node runs in its own pool worker
+            futures = [
+                executor.submit(cluster.simulate_node, jobs, policy, quantum, seed)
+                for jobs, policy in zip(plan['assignment'], plan['policies'])
+            ]
+        else:
+            # JSQ and work-based dispatch with I/O co-simulate the nodes in one worker
+            futures = [executor.submit(
+                cluster.simulate, processes, nodes, algorithm, dispatcher, latency,
+                quantum, seed, workers=1, parallel=False
+            )]
+        self.cluster_futures = futures
+        # Only partitioned runs need their node outcomes merged
+        node_policies = plan['policies'] if plan['assignment'] is not None else None
+        
+        self.clear_results_content()
+        tk.Label(
+            self.results_content,
+            text=f"Simulating {nodes} nodes...",
+            font=self.fonts['body'],
+            fg=self.colors['white'],
+            bg=self.colors['dark']
+        ).pack(expand=True)
+        
+        title = f"{algorithm.replace('_', ' ')} on {nodes} nodes ({dispatcher.replace('_', ' ')})"
+        self.root.after(50, self.poll_cluster, futures, node_policies, latency, title)
     
-    def display_results(self, calculation_results, algorithm):
-        """Display calculation results"""
-        # Clear previous results
-        for widget in self.results_content.winfo_children():
-            widget.destroy()
+    def poll_cluster(self, futures, node_policies, latency, title):
+        """Show the cluster run once the workers have finished"""
+        if futures is not self.cluster_futures:
+            return  # Superseded by a newer cluster run
+        if not all(future.done() for future in futures):
+            self.root.after(50, self.poll_cluster, futures, node_policies, latency, title)
+            return
         
-        results = calculation_results['results']
-        gantt_data = calculation_results['gantt']
+        try:
+            outcomes = [future.result() for future in futures]
+        except Exception as e:
+            messagebox.showerror("Error", f"Cluster simulation failed: {e}")
+            return
+        if node_policies is None:
+            run = outcomes[0]
+        else:
+            run = cluster.summarize(outcomes, node_policies, latency, True)
+        self.create_cluster_view(run, title)
+    
+    def display_results(self, calculation_results, algorithm):
+        """Display calculation results, building each tab on first selection"""
+        self.current_run = {
+            'results': calculation_results['results'],
+            'gantt': calculation_results['gantt'],
+            'metrics': calculation_results.get('metrics'),
+            'analysis': calculation_results.get('analysis'),
+            'deltas': calculation_results.get('deltas'),
+            'algorithm': algorithm
+        }
+        self.rendered_tabs = set()
         
-        # Create notebook for tabs
-        notebook = ttk.Notebook(self.results_content)
-        notebook.pack(fill=tk.BOTH, expand=True)
+        self.show_results_notebook()
+        self.render_selected_tab()
+    
+    def clear_results_content(self):
+        """Remove transient views, keeping the reusable results notebook"""
+        for widget in self.results_content.winfo_children():
+            if widget is self.results_notebook:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+    
+    def show_results_notebook(self):
+        """Show the results notebook, creating its (empty) tabs on first use"""
+        if self.results_notebook is None:
+            self.setup_ttk_styles()
+            self.clear_results_content()
+            self.results_notebook = ttk.Notebook(self.results_content)
+            
+            self.result_tabs = [
+                ("Results Table", self.create_results_table_tab, self.update_results_table_tab),
+                ("Gantt Chart", self.create_gantt_chart_tab, self.update_gantt_chart_tab),
+                ("Statistics", self.create_statistics_tab, self.update_statistics_tab),
+                ("Time Series", self.create_time_series_tab, self.update_time_series_tab)
+            ]
+            self.tab_frames = []
+            for text, _, _ in self.result_tabs:
+                frame = tk.Frame(self.results_notebook, bg=self.colors['white'])
+                self.results_notebook.add(frame, text=text)
+                self.tab_frames.append(frame)
+            
+            self.results_notebook.bind("<<NotebookTabChanged>>", lambda e: self.render_selected_tab())
+        elif not self.results_notebook.winfo_ismapped():
+            self.clear_results_content()
         
-        # Results Table Tab
-        self.create_results_table_tab(notebook, results, algorithm)
+        self.results_notebook.pack(fill=tk.BOTH, expand=True)
+        return self.results_notebook
+    
+    def render_selected_tab(self):
+        """Build (once) and fill the visible tab for the current run"""
+        if self.current_run is None:
+            return
         
-        # Gantt Chart Tab
-        self.create_gantt_chart_tab(notebook, gantt_data)
+        index = self.results_notebook.index(self.results_notebook.select())
+        if index in self.rendered_tabs:
+            return
         
-        # Statistics Tab
-        self.create_statistics_tab(notebook, results)
+        _, create, update = self.result_tabs[index]
+        frame = self.tab_frames[index]
+        if frame not in self.tab_widgets:
+            self.tab_widgets[frame] = create(frame)
+        update(self.tab_widgets[frame], self.current_run)
+        self.rendered_tabs.add(index)
     
-    def create_results_table_tab(self, notebook, results, algorithm):
-        """Create results table tab"""
-        table_frame = tk.Frame(notebook, bg=self.colors['white'])
-        notebook.add(table_frame, text="Results Table")
+    def create_results_table_tab(self, table_frame):
+        """Create results table tab widgets"""
+        table_frame.configure(bg=self.colors['white'])
         
         # Algorithm name
         algo_label = tk.Label(
             table_frame,
-            text=f"Algorithm: {algorithm.replace('_', ' ')}",
             font=self.fonts['heading'],
             fg=self.colors['primary'],
             bg=self.colors['white']
         )
         algo_label.pack(pady=(10, 20))
         
-        # Create table
-        columns = ['PID', 'Arrival', 'Burst', 'Completion', 'Turnaround', 'Waiting']
-        if any('priority' in r for r in results if r):
-            columns.insert(3, 'Priority')
-        
         # Table frame with scrollbar
         table_container = tk.Frame(table_frame, bg=self.colors['white'])
         table_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        # Headers
-        header_frame = tk.Frame(table_container, bg=self.colors['primary'])
-        header_frame.pack(fill=tk.X)
+        tree = ttk.Treeview(table_container, show='headings', style='Results.Treeview')
+        scrollbar = ttk.Scrollbar(table_container, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        for col, header in enumerate(columns):
-            label = tk.Label(
-                header_frame,
-                text=header,
-                font=self.fonts['heading'],
-                fg=self.colors['white'],
-                bg=self.colors['primary'],
-                width=12,
-                pady=8
-            )
-            label.grid(row=0, column=col, padx=1, sticky="ew")
+        tree.tag_configure('odd', background=self.colors['light'])
+        tree.tag_configure('even', background=self.colors['dark'])
         
-        # Data rows
-        data_frame = tk.Frame(table_container, bg=self.colors['white'])
-        data_frame.pack(fill=tk.X)
+        return {'label': algo_label, 'tree': tree, 'fill_job': None}
+    
+    def update_results_table_tab(self, widgets, run):
+        """Fill the results table, inserting rows in chunks so the first rows paint quickly"""
+        results = run['results']
+        widgets['label'].configure(text=f"Algorithm: {run['algorithm'].replace('_', ' ')}")
         
-        for i, result in enumerate(results):
-            if result is None:
-                continue
-                
-            bg_color = self.colors['light'] if i % 2 == 0 else self.colors['white']
-            
-            values = [
-                result['pid'],
-                result['arrival'],
-                result['burst']
-            ]
-            
-            if 'priority' in result:
-                values.append(result['priority'])
-            
-            values.extend([
-                result['completion'],
-                result['turnaround'],
-                result['waiting']
-            ])
-            
-            for col, value in enumerate(values):
-                label = tk.Label(
-                    data_frame,
-                    text=str(value),
-                    font=self.fonts['body'],
-                    bg=bg_color,
-                    width=12,
-                    pady=5
-                )
-                label.grid(row=i, column=col, padx=1, sticky="ew")
+        columns = ['PID', 'Arrival', 'Burst', 'Completion', 'Turnaround', 'Waiting']
+        keys = ['pid', 'arrival', 'burst', 'completion', 'turnaround', 'waiting']
+        if any('priority' in r for r in results if r):
+            columns.insert(3, 'Priority')
+            keys.insert(3, 'priority')
+        if any('tickets' in r for r in results if r):
+            columns.insert(3, 'Tickets')
+            keys.insert(3, 'tickets')
+        if any(r.get('io') for r in results if r):
+            columns.insert(keys.index('burst') + 1, 'I/O')
+            keys.insert(keys.index('burst') + 1, 'io')
+        if any('period' in r for r in results if r):
+            # Real-time rows report the worst job of each task
+            columns[3:3] = ['Period', 'Deadline']
+            keys[3:3] = ['period', 'deadline']
+            columns[columns.index('Turnaround')] = 'Max Response'
+            columns[columns.index('Waiting')] = 'Max Waiting'
+            columns.extend(['Jobs', 'Misses'])
+            keys.extend(['jobs', 'misses'])
+        
+        tree = widgets['tree']
+        if widgets['fill_job'] is not None:
+            self.root.after_cancel(widgets['fill_job'])
+            widgets['fill_job'] = None
+        tree.delete(*tree.get_children())
+        tree.configure(columns=columns)
+        for column in columns:
+            tree.heading(column, text=column)
+            tree.column(column, width=90, anchor=tk.CENTER)
+        
+        rows = [r for r in results if r is not None]
+        
+        def insert_chunk(start):
+            for i in range(start, min(start + 500, len(rows))):
+                tree.insert('', tk.END,
+                            values=[rows[i].get(key, '') for key in keys],
+                            tags=('odd' if i % 2 == 0 else 'even',))
+            if start + 500 < len(rows):
+                widgets['fill_job'] = self.root.after(1, insert_chunk, start + 500)
+            else:
+                widgets['fill_job'] = None
+        
+        insert_chunk(0)
     
-    def create_gantt_chart_tab(self, notebook, gantt_data):
-        """Create Gantt chart tab"""
-        chart_frame = tk.Frame(notebook, bg=self.colors['white'])
-        notebook.add(chart_frame, text="Gantt Chart")
+    def create_gantt_chart_tab(self, chart_frame):
+        """Create Gantt chart tab widgets"""
+        chart_frame.configure(bg=self.colors['white'])
         
         # Chart title
         title_label = tk.Label(
@@ -907,42 +1302,59 @@ class OSProcessCalculator:
         )
         canvas.pack(padx=20, pady=10)
         
+        return {'canvas': canvas}
+    
+    def update_gantt_chart_tab(self, widgets, run):
+        """Redraw the Gantt chart on the reused canvas"""
+        gantt_data = run['gantt']
+        canvas = widgets['canvas']
+        canvas.delete('all')
+        
         if not gantt_data:
             canvas.create_text(400, 100, text="No data to display", font=self.fonts['body'])
             return
         
         # Draw Gantt chart
-        max_time = max(segment['end'] for segment in gantt_data)
-        scale = 700 / max_time if max_time > 0 else 1
-        
-        colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6',
-                  '#1abc9c', '#d35400', '#34495e', '#16a085', '#c0392b']
+        chart_width = 700
+        max_time = gantt_data.end
+        scale = chart_width / max_time if max_time > 0 else 1
         
         y_position = 50
         x_offset = 50
         height = 40
         
-        for segment in gantt_data:
+        # Segments narrower than a pixel are skipped and labels are thinned,
+        # so long schedules cost at most a few items per pixel column
+        last_block_x = None
+        last_marker_x = None
+        
+        for segment in self.visible_segments(gantt_data, chart_width):
             x1 = x_offset + segment['start'] * scale
             x2 = x_offset + segment['end'] * scale
+            if last_block_x is not None and int(x2) <= last_block_x:
+                continue
+            last_block_x = int(x2)
             
             # Draw process block
-            color = colors[(segment['pid'] - 1) % len(colors)]
+            color = PROCESS_COLORS[(segment['pid'] - 1) % len(PROCESS_COLORS)]
             canvas.create_rectangle(x1, y_position, x2, y_position + height,
                                   fill=color, outline='white')
             
             # Draw process label
-            mid_x = (x1 + x2) / 2
-            canvas.create_text(mid_x, y_position + height/2,
-                              text=f"P{segment['pid']}", fill='white',
-                              font=self.fonts['body'])
+            if x2 - x1 >= 20:
+                mid_x = (x1 + x2) / 2
+                canvas.create_text(mid_x, y_position + height/2,
+                                  text=f"P{segment['pid']}", fill='white',
+                                  font=self.fonts['body'])
             
             # Draw time markers
-            canvas.create_line(x1, y_position + height,
-                              x1, y_position + height + 10)
-            canvas.create_text(x1, y_position + height + 20,
-                              text=str(segment['start']),
-                              font=self.fonts['small'])
+            if last_marker_x is None or x1 - last_marker_x >= 25:
+                canvas.create_line(x1, y_position + height,
+                                  x1, y_position + height + 10)
+                canvas.create_text(x1, y_position + height + 20,
+                                  text=str(round(segment['start'], 2)),
+                                  font=self.fonts['small'])
+                last_marker_x = x1
         
         # Draw final time marker
         final_x = x_offset + max_time * scale
@@ -951,25 +1363,30 @@ class OSProcessCalculator:
         canvas.create_text(final_x, y_position + height + 20,
                           text=str(max_time),
                           font=self.fonts['small'])
-
-    def create_statistics_tab(self, notebook, results):
-        """Create statistics tab"""
-        stats_frame = tk.Frame(notebook, bg=self.colors['dark'])
-        notebook.add(stats_frame, text="Statistics")
-        
-        # Calculate statistics
-        valid_results = [r for r in results if r is not None]
-        if not valid_results:
-            tk.Label(stats_frame,
-                    text="No data available",
-                    font=self.fonts['body'],
-                    fg=self.colors['white'],
-                    bg=self.colors['dark']).pack(pady=20)
-            return
-        
-        avg_turnaround = sum(r['turnaround'] for r in valid_results) / len(valid_results)
-        avg_waiting = sum(r['waiting'] for r in valid_results) / len(valid_results)
-        throughput = len(valid_results) / max(r['completion'] for r in valid_results)
+    
+    @staticmethod
+    def visible_segments(timeline, width):
+        """Segments of a timeline, sampled once per pixel column when there are more than width"""
+        if len(timeline) <= width:
+            return timeline
+        
+        # Query who ran at each pixel column and merge equal neighbours
+        step = timeline.end / width
+        segments = []
+        for column in range(width):
+            start = column * step
+            pid = timeline.pid_at(start)
+            if pid is None:
+                continue
+            if segments and segments[-1]['pid'] == pid and segments[-1]['end'] == start:
+                segments[-1]['end'] = start + step
+            else:
+                segments.append({'pid': pid, 'start': start, 'end': start + step})
+        return segments
+    
+    def create_statistics_tab(self, stats_frame):
+        """Create statistics tab widgets"""
+        stats_frame.configure(bg=self.colors['dark'])
         
         # Create statistics display with improved styling
         stats_container = tk.Frame(stats_frame, bg=self.colors['dark'])
@@ -985,15 +1402,20 @@ class OSProcessCalculator:
         )
         title_label.pack(pady=(0, 20))
         
-        stats = [
-            ("Average Turnaround Time:", f"{avg_turnaround:.2f} units"),
-            ("Average Waiting Time:", f"{avg_waiting:.2f} units"),
-            ("Throughput:", f"{throughput:.2f} processes/unit time"),
-            ("Total Processes:", str(len(valid_results))),
-            ("Total Time:", f"{max(r['completion'] for r in valid_results)} units")
+        labels = [
+            "Average Turnaround Time:",
+            "Average Waiting Time:",
+            "Throughput:",
+            "Total Processes:",
+            "Total Time:",
+            "CPU Utilization:",
+            "Device Utilization:",
+            "Deadline Misses:",
+            "Schedulability:"
         ]
         
-        for i, (label, value) in enumerate(stats):
+        values = []
+        for label in labels:
             row_frame = tk.Frame(stats_container, bg=self.colors['dark'])
             row_frame.pack(pady=10)
             
@@ -1005,11 +1427,424 @@ class OSProcessCalculator:
                     bg=self.colors['dark']).pack(side=tk.LEFT, padx=10)
             
             # Value with different color for better visibility
-            tk.Label(row_frame,
-                    text=value,
+            value_label = tk.Label(row_frame,
                     font=self.fonts['body'],
                     fg=self.colors['secondary'],
-                    bg=self.colors['dark']).pack(side=tk.LEFT, padx=10)
+                    bg=self.colors['dark'])
+            value_label.pack(side=tk.LEFT, padx=10)
+            values.append(value_label)
+        
+        # Per-process CPU share vs. ticket entitlement (proportional share only)
+        shares_label = tk.Label(
+            stats_container,
+            font=self.fonts['body'],
+            fg=self.colors['white'],
+            bg=self.colors['dark'],
+            justify=tk.LEFT
+        )
+        shares_label.pack(pady=(20, 0))
+        
+        return {'values': values, 'shares': shares_label}
+    
+    def update_statistics_tab(self, widgets, run):
+        """Fill the statistics tab for the current run"""
+        # Calculate statistics
+        summary = scheduling.compute_statistics(run['results'], run['gantt'])
+        if summary is None:
+            texts = ["No data available"] + [""] * (len(widgets['values']) - 1)
+        else:
+            texts = [
+                f"{summary['avg_turnaround']:.2f} units",
+                f"{summary['avg_waiting']:.2f} units",
+                f"{summary['throughput']:.2f} processes/unit time",
+                str(summary['count']),
+                f"{summary['total_time']} units",
+                f"{summary['cpu_utilization']:.1%}"
+            ]
+            metrics = run['metrics']
+            if metrics is not None:
+                texts[-1] = f"{metrics['cpu_utilization']:.1%}"
+            if metrics is not None and 'device_utilization' in metrics:
+                texts.append(f"{metrics['device_utilization']:.1%} ({metrics['devices']} device(s))")
+            else:
+                texts.append("-")
+            
+            analysis = run['analysis']
+            if analysis is not None:
+                verdict = "Schedulable" if analysis['schedulable'] else "Not schedulable"
+                texts.append(str(sum(r['misses'] for r in run['results'])))
+                texts.append(f"{verdict} ({analysis['test']}, U = {analysis['utilization']:.3f})")
+            else:
+                texts.extend(["-", "-"])
+        
+        for value_label, text in zip(widgets['values'], texts):
+            value_label.configure(text=text)
+        
+        shares = [r for r in run['results'] if r is not None and 'share' in r]
+        lines = []
+        if shares:
+            lines.append("CPU share while runnable vs. ticket entitlement:")
+            for r in shares[:20]:
+                lines.append(f"P{r['pid']} ({r['tickets']} tickets): "
+                             f"{r['share']:.1%} received, {r['entitlement']:.1%} entitled")
+            if len(shares) > 20:
+                lines.append(f"... and {len(shares) - 20} more (see Results Table)")
+        widgets['shares'].configure(text="\n".join(lines))
+    
+    def create_time_series_tab(self, series_frame):
+        """Create time series tab widgets"""
+        series_frame.configure(bg=self.colors['white'])
+        
+        title_label = tk.Label(
+            series_frame,
+            text="Load Over Time",
+            font=self.fonts['heading'],
+            fg=self.colors['dark'],
+            bg=self.colors['white']
+        )
+        title_label.pack(pady=(10, 20))
+        
+        canvas = tk.Canvas(
+            series_frame,
+            width=800,
+            height=390,
+            bg=self.colors['dark'],
+            relief=tk.SUNKEN,
+            bd=2
+        )
+        canvas.pack(padx=20, pady=10)
+        
+        return {'canvas': canvas}
+    
+    def update_time_series_tab(self, widgets, run):
+        """Plot CPU utilization, ready-queue length and throughput, one point per pixel column"""
+        canvas = widgets['canvas']
+        canvas.delete('all')
+        
+        if not run['gantt']:
+            canvas.create_text(400, 100, text="No data to display", font=self.fonts['body'])
+            return
+        
+        x_offset = 50
+        chart_width = 700
+        panel_height = 90
+        panel_gap = 30
+        
+        series = TimeSeries.from_schedule(run['results'], run['gantt'], run['deltas'])
+        samples = series.sample(chart_width)
+        points = len(samples['time'])
+        step = chart_width / points
+        
+        panels = [
+            ("CPU Utilization", samples['utilization'], self.colors['success']),
+            ("Ready Queue Length", samples['queue_length'], self.colors['warning']),
+            ("Completions / Time Unit", samples['throughput'], self.colors['secondary'])
+        ]
+        
+        y_position = 25
+        for title, values, color in panels:
+            top = max(values) or 1
+            bottom_y = y_position + panel_height
+            canvas.create_text(x_offset, y_position - 12, text=title, anchor=tk.W,
+                              fill=self.colors['white'], font=self.fonts['small'])
+            canvas.create_text(x_offset - 5, y_position, text=f"{top:.2f}", anchor=tk.E,
+                              fill=self.colors['gray'], font=self.fonts['small'])
+            canvas.create_text(x_offset - 5, bottom_y, text="0", anchor=tk.E,
+                              fill=self.colors['gray'], font=self.fonts['small'])
+            canvas.create_line(x_offset, bottom_y, x_offset + chart_width, bottom_y,
+                              fill=self.colors['gray'])
+            
+            # One polyline per series; each point is the average over its column
+            coords = []
+            for k, value in enumerate(values):
+                coords.append(x_offset + (k + 0.5) * step)
+                coords.append(bottom_y - value / top * panel_height)
+            if len(coords) >= 4:
+                canvas.create_line(*coords, fill=color, width=2)
+            else:
+                canvas.create_line(x_offset, coords[1], x_offset + chart_width, coords[1],
+                                  fill=color, width=2)
+            
+            y_position += panel_height + panel_gap
+        
+        # Time axis under the last panel
+        axis_y = y_position - panel_gap
+        end_time = series.size * series.resolution
+        for tick in range(6):
+            x = x_offset + tick * chart_width / 5
+            canvas.create_text(x, axis_y + 12, text=f"{end_time * tick / 5:g}",
+                              fill=self.colors['white'], font=self.fonts['small'])
+    
+    def create_comparison_view(self):
+        """Create the side-by-side view for a "Compare All" run"""
+        self.clear_results_content()
+        
+        compare_frame = tk.Frame(self.results_content, bg=self.colors['dark'])
+        compare_frame.pack(fill=tk.BOTH, expand=True)
+        
+        title_label = tk.Label(
+            compare_frame,
+            text="Algorithm Comparison",
+            font=self.fonts['heading'],
+            fg=self.colors['white'],
+            bg=self.colors['dark']
+        )
+        title_label.pack(pady=(10, 10))
+        
+        # One Gantt lane per algorithm on a shared time axis
+        self.comparison_canvas = tk.Canvas(
+            compare_frame,
+            width=800,
+            height=len(ALGORITHMS) * 34 + 60,
+            bg=self.colors['dark'],
+            relief=tk.SUNKEN,
+            bd=2
+        )
+        self.comparison_canvas.pack(padx=20, pady=10)
+        
+        # Metrics table
+        table_frame = tk.Frame(compare_frame, bg=self.colors['primary'])
+        table_frame.pack(padx=20, pady=10)
+        
+        columns = ['Algorithm', 'Avg Turnaround', 'Avg Waiting', 'Throughput', 'Total Time']
+        for col, header in enumerate(columns):
+            tk.Label(
+                table_frame,
+                text=header,
+                font=self.fonts['heading'],
+                fg=self.colors['white'],
+                bg=self.colors['primary'],
+                width=14,
+                pady=8
+            ).grid(row=0, column=col, padx=1, sticky="ew")
+        
+        self.comparison_rows = {}
+        for row, (_, value) in enumerate(ALGORITHMS, start=1):
+            bg_color = self.colors['light'] if row % 2 else self.colors['dark']
+            labels = []
+            for col in range(len(columns)):
+                label = tk.Label(
+                    table_frame,
+                    text=value.replace('_', ' ') if col == 0 else "Running...",
+                    font=self.fonts['body'],
+                    fg=self.colors['white'],
+                    bg=bg_color,
+                    width=14,
+                    pady=5
+                )
+                label.grid(row=row, column=col, padx=1, sticky="ew")
+                labels.append(label)
+            self.comparison_rows[value] = labels
+        
+        self.draw_comparison_chart()
+    
+    def update_comparison_view(self, algorithm):
+        """Fill in the metrics row and Gantt lane of a finished run"""
+        outcome = self.comparison_results[algorithm]
+        labels = self.comparison_rows[algorithm]
+        
+        if isinstance(outcome, Exception):
+            values = [f"Error: {outcome}", "", "", ""]
+        else:
+            summary = scheduling.compute_statistics(outcome['results'])
+            if summary is None:
+                values = ["-", "-", "-", "-"]
+            else:
+                values = [
+                    f"{summary['avg_turnaround']:.2f}",
+                    f"{summary['avg_waiting']:.2f}",
+                    f"{summary['throughput']:.2f}",
+                    str(summary['total_time'])
+                ]
+        
+        for label, value in zip(labels[1:], values):
+            label.configure(text=value)
+        
+        self.draw_comparison_chart()
+    
+    def draw_comparison_chart(self):
+        """Redraw the stacked Gantt lanes scaled to the longest finished run"""
+        canvas = self.comparison_canvas
+        canvas.delete('all')
+        
+        finished = {
+            algorithm: outcome['gantt']
+            for algorithm, outcome in self.comparison_results.items()
+            if not isinstance(outcome, Exception)
+        }
+        max_time = max((gantt.end for gantt in finished.values()), default=0)
+        
+        x_offset = 190
+        chart_width = 580
+        scale = chart_width / max_time if max_time > 0 else 1
+        lane_height = 28
+        lane_gap = 6
+        y_position = 20
+        
+        for _, algorithm in ALGORITHMS:
+            canvas.create_text(10, y_position + lane_height / 2,
+                              text=algorithm.replace('_', ' '), anchor=tk.W,
+                              fill=self.colors['white'], font=self.fonts['small'])
+            
+            if algorithm not in self.comparison_results:
+                canvas.create_text(x_offset, y_position + lane_height / 2,
+                                  text="Running...", anchor=tk.W,
+                                  fill=self.colors['gray'], font=self.fonts['small'])
+            elif algorithm not in finished:
+                canvas.create_text(x_offset, y_position + lane_height / 2,
+                                  text="Failed", anchor=tk.W,
+                                  fill=self.colors['danger'], font=self.fonts['small'])
+            else:
+                for segment in self.visible_segments(finished[algorithm], chart_width):
+                    x1 = x_offset + segment['start'] * scale
+                    x2 = x_offset + segment['end'] * scale
+                    color = PROCESS_COLORS[(segment['pid'] - 1) % len(PROCESS_COLORS)]
+                    canvas.create_rectangle(x1, y_position, x2, y_position + lane_height,
+                                          fill=color, outline='white')
+                    if x2 - x1 > 20:
+                        canvas.create_text((x1 + x2) / 2, y_position + lane_height / 2,
+                                          text=f"P{segment['pid']}", fill='white',
+                                          font=self.fonts['small'])
+            
+            y_position += lane_height + lane_gap
+        
+        # Shared time axis
+        if max_time > 0:
+            canvas.create_line(x_offset, y_position, x_offset + chart_width, y_position,
+                              fill=self.colors['white'])
+            step = max(1, max_time // 10)
+            for tick in range(0, max_time + 1, step):
+                x = x_offset + tick * scale
+                canvas.create_line(x, y_position, x, y_position + 6, fill=self.colors['white'])
+                canvas.create_text(x, y_position + 16, text=str(tick),
+                                  fill=self.colors['white'], font=self.fonts['small'])
+    
+    def create_cluster_view(self, run, title):
+        """Show per-node Gantt lanes, per-node metrics and cluster-wide metrics"""
+        self.clear_results_content()
+        
+        cluster_frame = tk.Frame(self.results_content, bg=self.colors['dark'])
+        cluster_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tk.Label(
+            cluster_frame,
+            text=title,
+            font=self.fonts['heading'],
+            fg=self.colors['white'],
+            bg=self.colors['dark']
+        ).pack(pady=(10, 10))
+        
+        # One Gantt lane per node on a shared time axis
+        node_rows = run['nodes']
+        lane_height = 28
+        lane_gap = 6
+        canvas = tk.Canvas(
+            cluster_frame,
+            width=800,
+            height=min(len(node_rows), 12) * (lane_height + lane_gap) + 60,
+            bg=self.colors['dark'],
+            relief=tk.SUNKEN,
+            bd=2
+        )
+        canvas.pack(padx=20, pady=10)
+        
+        max_time = run['metrics']['makespan']
+        x_offset = 80
+        chart_width = 690
+        scale = chart_width / max_time if max_time > 0 else 1
+        y_position = 20
+        
+        for row in node_rows[:12]:
+            canvas.create_text(10, y_position + lane_height / 2,
+                              text=f"Node {row['node']}", anchor=tk.W,
+                              fill=self.colors['white'], font=self.fonts['small'])
+            for segment in self.visible_segments(row['gantt'], chart_width):
+                x1 = x_offset + segment['start'] * scale
+                x2 = x_offset + segment['end'] * scale
+                color = PROCESS_COLORS[(segment['pid'] - 1) % len(PROCESS_COLORS)]
+                canvas.create_rectangle(x1, y_position, x2, y_position + lane_height,
+                                      fill=color, outline='white')
+                if x2 - x1 > 20:
+                    canvas.create_text((x1 + x2) / 2, y_position + lane_height / 2,
+                                      text=f"P{segment['pid']}", fill='white',
+                                      font=self.fonts['small'])
+            y_position += lane_height + lane_gap
+        
+        if max_time > 0:
+            canvas.create_line(x_offset, y_position, x_offset + chart_width, y_position,
+                              fill=self.colors['white'])
+            step = max(1, int(max_time // 10))
+            for tick in range(0, int(max_time) + 1, step):
+                x = x_offset + tick * scale
+                canvas.create_line(x, y_position, x, y_position + 6, fill=self.colors['white'])
+                canvas.create_text(x, y_position + 16, text=str(tick),
+                                  fill=self.colors['white'], font=self.fonts['small'])
+        
+        # Per-node metrics table
+        table_frame = tk.Frame(cluster_frame, bg=self.colors['primary'])
+        table_frame.pack(padx=20, pady=10)
+        
+        columns = ['Node', 'Jobs', 'Avg Turnaround', 'Avg Waiting', 'CPU Utilization']
+        for col, header in enumerate(columns):
+            tk.Label(
+                table_frame,
+                text=header,
+                font=self.fonts['heading'],
+                fg=self.colors['white'],
+                bg=self.colors['primary'],
+                width=14,
+                pady=8
+            ).grid(row=0, column=col, padx=1, sticky="ew")
+        
+        for i, row in enumerate(node_rows[:12], start=1):
+            bg_color = self.colors['light'] if i % 2 else self.colors['dark']
+            values = [
+                str(row['node']),
+                str(row['jobs']),
+                f"{row['avg_turnaround']:.2f}",
+                f"{row['avg_waiting']:.2f}",
+                f"{row['cpu_utilization'] * 100:.1f}%"
+            ]
+            for col, value in enumerate(values):
+                tk.Label(
+                    table_frame,
+                    text=value,
+                    font=self.fonts['body'],
+                    fg=self.colors['white'],
+                    bg=bg_color,
+                    width=14,
+                    pady=5
+                ).grid(row=i, column=col, padx=1, sticky="ew")
+        
+        # Cluster-wide metrics
+        metrics = run['metrics']
+        summary = (
+            f"Jobs: {metrics['jobs']}   Avg Turnaround: {metrics['avg_turnaround']:.2f}   "
+            f"Avg Waiting: {metrics['avg_waiting']:.2f}   P95 Turnaround: {metrics['p95_turnaround']}\n"
+            f"Makespan: {metrics['makespan']}   Throughput: {metrics['throughput']:.3f}   "
+            f"CPU Utilization: {metrics['cpu_utilization'] * 100:.1f}%   "
+            f"Imbalance: {metrics['imbalance']:.2f}   "
+            f"({'nodes simulated in parallel' if run['parallel'] else 'nodes co-simulated'})"
+        )
+        tk.Label(
+            cluster_frame,
+            text=summary,
+            font=self.fonts['body'],
+            fg=self.colors['white'],
+            bg=self.colors['dark'],
+            justify=tk.LEFT
+        ).pack(padx=20, pady=(0, 10))
 
 if __name__ == "__main__":
+    import argparse
+    
+    # --watch was dispatched to batch.py at the top of this file
+    parser = argparse.ArgumentParser(
+        description="OS Process Management Calculator",
+        epilog="python main.py --watch DIR [options] processes workload files without "
+               "opening the window (see python batch.py --help for the options)",
+        allow_abbrev=False
+    )
+    parser.parse_args()
+    
     app = OSProcessCalculator()
\ No newline at end of file
@@ -0,0 +1,403 @@
+"""Scheduling policies for the event engine, registered by name.
+
+The engine (engine.Engine) owns time, bursts, I/O devices and bookkeeping;
+a policy only orders the ready processes. The engine calls:
+
+    on_arrival(i, now)        process i became ready (arrival or I/O done)
+    pick_next(now)            remove and return the ready process to run next
+    on_preempt(i, now, ran)   i left the CPU with work left (quantum expired
+                              or preempted) and is ready again
+    on_complete(i, now, ran)  i finished its CPU burst (blocks on I/O or exits)
+
+where i is the index of the process in submission order and ran the CPU
+time it received since it was dispatched. Preemptive policies also answer
+should_preempt(running, now) whenever a process becomes ready while another
+runs, and time_slice(i) bounds how long a dispatched process runs (its whole
+burst, or one quantum for quantum policies).
+
+Registered policies appear in the GUI and in engine.simulate by name:
+
+    @register
+    class LongestJobFirst(KeyedPolicy):
+        name = "LJF"
+        label = "Longest Job First (LJF)"
+
+        def key(self, i):
+            return -self.engine.remaining[i]
+"""
+import heapq
+import random
+from collections import deque
+
+POLICIES = {}
+
+# Stride of a process holding one ticket
+STRIDE1 = 1 << 20
+
+
+def register(policy):
+    """Class decorator adding a policy to the registry under its name"""
+    if not policy.name:
+        raise ValueError("Policies need a name")
+    POLICIES[policy.name] = policy
+    return policy
+
+
+def get_policy(name):
+    """Policy class registered under name"""
+    try:
+        return POLICIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm: {name}") from None
+
+
+def create(algorithm, quantum=None, seed=None):
+    """Policy instance for a registered name (policy instances are passed through)"""
+    if isinstance(algorithm, Policy):
+        return algorithm
+    return get_policy(algorithm)(quantum, seed)
+
+
+class FenwickTree:
+    """Prefix sums over per-process ticket counts with O(log n) update and search"""
+
+    def __init__(self, n=0):
+        self.tree = [0] * (n + 1)
+        self.total = 0
+
+    def __len__(self):
+        return len(self.tree) - 1
+
+    def append(self):
+        """Add a position with count 0 at the end"""
+        # Node j covers positions (j - lowbit(j), j], all but the new one already present
+        j = len(self.tree)
+        self.tree.append(self.prefix(j - 1) - self.prefix(j - (j & -j)))
+
+    def prefix(self, i):
+        """Sum of the counts of the first i positions"""
+        total = 0
+        while i:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def add(self, i, delta):
+        """Add delta to the count of position i"""
+        self.total += delta
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, r):
+        """Smallest position whose prefix sum exceeds r (0 <= r < total)"""
+        position = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            following = position + step
+            if following < len(self.tree) and self.tree[following] <= r:
+                position = following
+                r -= self.tree[following]
+            step >>= 1
+        return position
+
+
+class Policy:
+    """Base class of scheduling policies (see the module docstring for the hooks)"""
+
+    name = None
+    label = None
+    preemptive = False
+    uses_quantum = False
+    uses_seed = False
+    fields = ()     # per-process inputs the policy reads, e.g. ('priority',)
+
+    def __init__(self, quantum=None, seed=None):
+        if self.uses_quantum and (quantum is None or quantum <= 0):
+            raise ValueError("Time quantum must be positive")
+        self.quantum = quantum
+        self.seed = seed
+        self.engine = None
+
+    def bind(self, engine):
+        """Attach the policy to the engine whose processes it schedules"""
+        self.engine = engine
+
+    def on_submit(self, i):
+        """Check the inputs of a newly submitted process"""
+        process = self.engine.processes[i]
+        for field in self.fields:
+            if field not in process:
+                raise ValueError(f"Process P{process['pid']} has no {field}")
+
+    def on_arrival(self, i, now):
+        raise NotImplementedError
+
+    def pick_next(self, now):
+        raise NotImplementedError
+
+    def on_preempt(self, i, now, ran):
+        self.on_arrival(i, now)
+
+    def on_complete(self, i, now, ran):
+        pass
+
+    def should_preempt(self, running, now):
+        return False
+
+    def time_slice(self, i):
+        """CPU time to give process i when it is dispatched"""
+        remaining = self.engine.remaining[i]
+        return min(self.quantum, remaining) if self.uses_quantum else remaining
+
+    def report(self, order):
+        """Extra result columns, one list per field for the process indices in order"""
+        processes = self.engine.processes
+        return {field: [processes[i][field] for i in order] for field in self.fields}
+
+
+@register
+class FirstComeFirstServe(Policy):
+    """Ready processes run in the order they became ready"""
+
+    name = "FCFS"
+    label = "First Come First Serve (FCFS)"
+
+    def __init__(self, quantum=None, seed=None):
+        super().__init__(quantum, seed)
+        self.queue = deque()
+
+    def on_arrival(self, i, now):
+        self.queue.append(i)
+
+    def pick_next(self, now):
+        return self.queue.popleft()
+
+
+class KeyedPolicy(Policy):
+    """Ready heap ordered by key(i), ties broken by submission order"""
+
+    def __init__(self, quantum=None, seed=None):
+        super().__init__(quantum, seed)
+        self.heap = []
+
+    def key(self, i):
+        raise NotImplementedError
+
+    def on_arrival(self, i, now):
+        heapq.heappush(self.heap, (self.key(i), i))
+
+    def pick_next(self, now):
+        return heapq.heappop(self.heap)[1]
+
+    def should_preempt(self, running, now):
+        return self.heap[0] < (self.key(running), running)
+
+
+@register
+class ShortestJobFirst(KeyedPolicy):
+    name = "SJF"
+    label = "Shortest Job First (SJF)"
+
+    def key(self, i):
+        return self.engine.remaining[i]
+
+
+@register
+class ShortestRemainingTimeFirst(ShortestJobFirst):
+    name = "SRTF"
+    label = "Shortest Remaining Time First (SRTF)"
+    preemptive = True
+
+
+@register
+class RoundRobin(FirstComeFirstServe):
+    """FIFO with a time quantum
+
+    Processes that become ready while another one runs join the queue in
+    submission order when its quantum ends, ahead of it if it is requeued,
+    which is how the classic implementation (scheduling.round_robin)
+    orders them.
+    """
+
+    name = "RR"
+    label = "Round Robin (RR)"
+    uses_quantum = True
+
+    def __init__(self, quantum=None, seed=None):
+        super().__init__(quantum, seed)
+        self.running = None
+        self.arrived = []
+
+    def on_arrival(self, i, now):
+        if self.running is None:
+            self.queue.append(i)
+        else:
+            self.arrived.append(i)
+
+    def pick_next(self, now):
+        self.running = self.queue.popleft()
+        return self.running
+
+    def time_slice(self, i):
+        return min(self.quantum, self.engine.remaining[i])
+
+    def on_preempt(self, i, now, ran):
+        self.on_complete(i, now, ran)
+        self.queue.append(i)
+
+    def on_complete(self, i, now, ran):
+        if self.arrived:
+            self.arrived.sort()
+            self.queue.extend(self.arrived)
+            self.arrived.clear()
+        self.running = None
+
+
+@register
+class PriorityPreemptive(KeyedPolicy):
+    name = "Priority_Preemptive"
+    label = "Priority (Preemptive)"
+    preemptive = True
+    fields = ('priority',)
+
+    def key(self, i):
+        return self.engine.processes[i]['priority']
+
+
+@register
+class PriorityNonPreemptive(PriorityPreemptive):
+    name = "Priority_NonPreemptive"
+    label = "Priority (Non-Preemptive)"
+    preemptive = False
+
+
+class ProportionalPolicy(Policy):
+    """CPU shares proportional to 'tickets', with share accounting for the results
+
+    G is the running integral of 1 / (tickets of runnable processes), so each
+    process's entitlement over a runnable interval is tickets * (G_end - G_start).
+    """
+
+    uses_quantum = True
+    fields = ('tickets',)
+
+    def __init__(self, quantum=None, seed=None):
+        super().__init__(quantum, seed)
+        self.tickets = []
+        self.active_tickets = 0
+        self.share_integral = 0.0
+        self.integral_time = 0
+        self.integral_start = []
+        self.runnable_since = []
+        self.entitled = []
+        self.runnable_time = []
+
+    def on_submit(self, i):
+        super().on_submit(i)
+        tickets = self.engine.processes[i]['tickets']
+        if not isinstance(tickets, int) or tickets <= 0:
+            raise ValueError("Tickets must be positive integers")
+        self.tickets.append(tickets)
+        self.integral_start.append(0.0)
+        self.runnable_since.append(0)
+        self.entitled.append(0.0)
+        self.runnable_time.append(0)
+
+    def advance_integral(self, now):
+        if self.active_tickets:
+            self.share_integral += (now - self.integral_time) / self.active_tickets
+        self.integral_time = now
+
+    def join(self, i, now):
+        """Process i became runnable"""
+        self.advance_integral(now)
+        self.active_tickets += self.tickets[i]
+        self.integral_start[i] = self.share_integral
+        self.runnable_since[i] = now
+
+    def leave(self, i, now):
+        """Process i stopped being runnable"""
+        self.advance_integral(now)
+        self.entitled[i] += self.tickets[i] * (self.share_integral - self.integral_start[i])
+        self.runnable_time[i] += now - self.runnable_since[i]
+        self.active_tickets -= self.tickets[i]
+
+    def on_complete(self, i, now, ran):
+        self.leave(i, now)
+
+    def report(self, order):
+        bursts = self.engine.bursts
+        return {
+            'tickets': [self.tickets[i] for i in order],
+            'share': [sum(bursts[i][0::2]) / self.runnable_time[i] for i in order],
+            'entitlement': [self.entitled[i] / self.runnable_time[i] for i in order]
+        }
+
+
+@register
+class Lottery(ProportionalPolicy):
+    """Draw one ticket per quantum from a Fenwick tree over the ready processes"""
+
+    name = "Lottery"
+    label = "Lottery"
+    uses_seed = True
+
+    def __init__(self, quantum=None, seed=None):
+        super().__init__(quantum, seed)
+        self.rng = random.Random(seed)
+        self.ready = FenwickTree()
+
+    def on_submit(self, i):
+        super().on_submit(i)
+        self.ready.append()
+
+    def on_arrival(self, i, now):
+        self.join(i, now)
+        self.ready.add(i, self.tickets[i])
+
+    def on_preempt(self, i, now, ran):
+        self.ready.add(i, self.tickets[i])
+
+    def pick_next(self, now):
+        i = self.ready.find(self.rng.randrange(self.ready.total))
+        self.ready.add(i, -self.tickets[i])
+        return i
+
+
+@register
+class Stride(ProportionalPolicy):
+    """Run the lowest pass; each quantum advances a pass by STRIDE1 / tickets"""
+
+    name = "Stride"
+    label = "Stride"
+
+    def __init__(self, quantum=None, seed=None):
+        super().__init__(quantum, seed)
+        self.ready = []
+        self.strides = []
+        self.passes = []
+        self.global_pass = 0.0
+
+    def on_submit(self, i):
+        super().on_submit(i)
+        self.strides.append(STRIDE1 / self.tickets[i])
+        self.passes.append(0.0)
+
+    def on_arrival(self, i, now):
+        self.join(i, now)
+        self.passes[i] = max(self.passes[i], self.global_pass)
+        heapq.heappush(self.ready, (self.passes[i], i))
+
+    def on_preempt(self, i, now, ran):
+        self.passes[i] += self.strides[i] * ran / self.quantum
+        heapq.heappush(self.ready, (self.passes[i], i))
+
+    def on_complete(self, i, now, ran):
+        self.passes[i] += self.strides[i] * ran / self.quantum
+        super().on_complete(i, now, ran)
+
+    def pick_next(self, now):
+        self.global_pass, i = heapq.heappop(self.ready)
+        return i
@@ -0,0 +1,311 @@
+"""Real-time scheduling of periodic tasks: EDF and Rate Monotonic.
+
+A task is a process dict with 'arrival' (phase), 'burst' (worst-case
+execution time), 'period' and 'deadline' (relative, defaults to the period).
+Jobs are released from a heap keyed by release time and dispatched from a
+ready heap keyed by absolute deadline (EDF) or period (RM), so simulation
+costs O(log n) per release/preemption instead of scanning every tick.
+
+Schedulability analysis works on the task parameters alone:
+  * EDF: exact utilization test for implicit deadlines, otherwise the
+    processor-demand test with Quick Processor-demand Analysis (QPA)
+  * RM: Liu & Layland and hyperbolic bounds as fast sufficient tests,
+    falling back to exact response-time analysis per task
+"""
+import heapq
+import math
+
+from timeline import GanttTimeline
+
+ALGORITHMS = ("EDF", "RM")
+
+# Simulations stop after this many of the longest period when the
+# hyperperiod is larger (or undefined for non-integer periods)
+HORIZON_PERIODS = 100
+
+# Tolerance for floating-point utilization sums (e.g. 0.1 + 0.2 + 0.7)
+EPSILON = 1e-9
+
+
+def get_deadline(task):
+    """Relative deadline of a task (implicit deadline when not given)"""
+    return task.get('deadline') or task['period']
+
+
+def validate(tasks):
+    """Raise ValueError if a task cannot be scheduled periodically"""
+    for task in tasks:
+        if task['burst'] <= 0 or task['period'] <= 0 or get_deadline(task) <= 0:
+            raise ValueError(f"Invalid timing parameters for Process P{task['pid']}")
+        if task['arrival'] < 0:
+            raise ValueError(f"Invalid arrival time for Process P{task['pid']}")
+
+
+def default_horizon(tasks):
+    """Largest phase plus one hyperperiod, capped at HORIZON_PERIODS longest periods"""
+    if not tasks:
+        return 0
+    periods = [task['period'] for task in tasks]
+    cap = max(periods) * HORIZON_PERIODS
+    if all(isinstance(period, int) for period in periods):
+        cap = min(cap, math.lcm(*periods))
+    return max(task['arrival'] for task in tasks) + cap
+
+
+def simulate(tasks, algorithm, horizon=None):
+    """Simulate periodic tasks under EDF or RM up to the horizon
+
+    Late jobs keep running until they finish (soft deadlines). Jobs that are
+    unfinished at the horizon count as misses if their deadline has passed.
+    Each result row reports jobs released, deadline misses and the worst
+    response time seen ('turnaround'; 'waiting' is that minus the burst).
+    'deltas' records per-job ready-queue changes and completion times.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    validate(tasks)
+    if horizon is None:
+        horizon = default_horizon(tasks)
+
+    n = len(tasks)
+    jobs = [0] * n
+    misses = [0] * n
+    worst_response = [0] * n
+    last_completion = [None] * n
+
+    releases = [(task['arrival'], i) for i, task in enumerate(tasks)]
+    heapq.heapify(releases)
+
+    # Jobs are lists [key, task, release, absolute deadline, remaining];
+    # list comparison orders them by key, then task index, then release
+    ready = []
+    ready_deltas = []
+    completed = []
+    running = None
+    gantt = GanttTimeline()
+    busy = 0
+    time = 0
+
+    while True:
+        next_release = releases[0][0] if releases else math.inf
+        next_completion = time + running[4] if running is not None else math.inf
+        now = min(next_release, next_completion, horizon)
+
+        if running is not None and now > time:
+            # Set exactly on completion so float times cannot leave a residue
+            running[4] = 0 if now == next_completion else running[4] - (now - time)
+            busy += now - time
+            gantt.append(tasks[running[1]]['pid'], time, now)
+        time = now
+
+        if running is not None and running[4] <= 0:
+            i = running[1]
+            response = time - running[2]
+            worst_response[i] = max(worst_response[i], response)
+            last_completion[i] = time
+            completed.append(time)
+            if time > running[3]:
+                misses[i] += 1
+            running = None
+
+        if time >= horizon:
+            break
+
+        while releases and releases[0][0] <= time:
+            release, i = heapq.heappop(releases)
+            task = tasks[i]
+            deadline = release + get_deadline(task)
+            key = deadline if algorithm == "EDF" else task['period']
+            heapq.heappush(ready, [key, i, release, deadline, task['burst']])
+            ready_deltas.append((time, 1))
+            jobs[i] += 1
+            if release + task['period'] < horizon:
+                heapq.heappush(releases, (release + task['period'], i))
+
+        if running is not None and ready and ready[0] < running:
+            heapq.heappush(ready, running)
+            ready_deltas.append((time, 1))
+            running = None
+        if running is None and ready:
+            running = heapq.heappop(ready)
+            ready_deltas.append((time, -1))
+
+    # Unfinished jobs: count overdue ones and use their age as a response bound
+    pending = ready + ([running] if running is not None else [])
+    for _, i, release, deadline, _ in pending:
+        worst_response[i] = max(worst_response[i], horizon - release)
+        if deadline <= horizon:
+            misses[i] += 1
+
+    results = []
+    for i, task in enumerate(tasks):
+        results.append({
+            'pid': task['pid'],
+            'arrival': task['arrival'],
+            'burst': task['burst'],
+            'period': task['period'],
+            'deadline': get_deadline(task),
+            'jobs': jobs[i],
+            'misses': misses[i],
+            'completion': last_completion[i] if last_completion[i] is not None else horizon,
+            'turnaround': worst_response[i],
+            'waiting': worst_response[i] - task['burst']
+        })
+
+    metrics = {'cpu_utilization': busy / horizon if horizon else 0}
+    return {
+        'results': results,
+        'gantt': gantt,
+        'metrics': metrics,
+        'analysis': analyze(tasks, algorithm),
+        'deltas': {'ready': ready_deltas, 'completed': completed}
+    }
+
+
+def utilization(tasks):
+    """Total processor utilization sum(C/T)"""
+    return sum(task['burst'] / task['period'] for task in tasks)
+
+
+def liu_layland_bound(n):
+    """Liu & Layland RM utilization bound n(2^(1/n) - 1)"""
+    return n * (2 ** (1 / n) - 1) if n else 1.0
+
+
+def response_time(task, higher, limit):
+    """Worst-case response time of task under fixed-priority preemption by higher
+
+    higher is a list of (period, burst) pairs. Returns None as soon as the
+    iteration exceeds limit.
+    """
+    burst = task['burst']
+    response = burst + sum(c for _, c in higher)
+    while response <= limit:
+        demand = burst
+        for period, c in higher:
+            demand += -(-response // period) * c
+        if demand == response:
+            return response
+        response = demand
+    return None
+
+
+def rm_order(tasks):
+    """Task indices from highest to lowest RM priority (shorter period first)"""
+    return sorted(range(len(tasks)), key=lambda i: (tasks[i]['period'], i))
+
+
+def rm_deadline(task):
+    """Deadline used by the RM analysis (response-time analysis assumes D <= T)"""
+    return min(get_deadline(task), task['period'])
+
+
+def rm_schedulable(tasks):
+    """Decide RM schedulability, returning (schedulable, name of the deciding test)"""
+    total = utilization(tasks)
+    if total > 1 + EPSILON:
+        return False, "utilization > 1"
+
+    implicit = all(get_deadline(task) >= task['period'] for task in tasks)
+    if implicit and total <= liu_layland_bound(len(tasks)):
+        return True, "Liu & Layland bound"
+    if implicit and math.prod(task['burst'] / task['period'] + 1 for task in tasks) <= 2:
+        return True, "hyperbolic bound"
+
+    # Per priority level, prefix sums give an O(1) lower bound (one job of
+    # every higher-priority task) and upper bound (Bini & Baruah) on the
+    # response time; exact response-time analysis only runs in between
+    higher = []
+    sum_burst = 0
+    sum_util = 0
+    sum_weighted = 0
+    exact = False
+    for i in rm_order(tasks):
+        task = tasks[i]
+        deadline = rm_deadline(task)
+        if task['burst'] + sum_burst > deadline:
+            return False, "response-time analysis"
+        if sum_util < 1 and (task['burst'] + sum_weighted) / (1 - sum_util) > deadline:
+            exact = True
+            if response_time(task, higher, deadline) is None:
+                return False, "response-time analysis"
+
+        utilization_i = task['burst'] / task['period']
+        higher.append((task['period'], task['burst']))
+        sum_burst += task['burst']
+        sum_util += utilization_i
+        sum_weighted += task['burst'] * (1 - utilization_i)
+
+    return True, "response-time analysis" if exact else "response-time bound"
+
+
+def demand(tasks, t):
+    """Processor demand h(t): work of all jobs with release and deadline in [0, t]"""
+    total = 0
+    for task in tasks:
+        deadline = get_deadline(task)
+        if t >= deadline:
+            total += (math.floor((t - deadline) / task['period']) + 1) * task['burst']
+    return total
+
+
+def last_deadline_before(tasks, t):
+    """Largest absolute deadline strictly before t (synchronous release)"""
+    latest = 0
+    for task in tasks:
+        deadline = get_deadline(task)
+        if deadline < t:
+            k = math.ceil((t - deadline) / task['period']) - 1
+            latest = max(latest, deadline + k * task['period'])
+    return latest
+
+
+def edf_schedulable(tasks):
+    """Decide EDF schedulability, returning (schedulable, name of the deciding test)"""
+    total = utilization(tasks)
+    if total > 1 + EPSILON:
+        return False, "utilization > 1"
+    if all(get_deadline(task) >= task['period'] for task in tasks):
+        return True, "utilization <= 1"
+    if not tasks:
+        return True, "utilization <= 1"
+
+    # Length of the synchronous busy period bounds the deadlines to check
+    busy = sum(task['burst'] for task in tasks)
+    while True:
+        work = sum(math.ceil(busy / task['period']) * task['burst'] for task in tasks)
+        if work == busy:
+            break
+        busy = work
+    limit = busy
+    if total < 1 - EPSILON:
+        limit = min(limit, max(
+            max(get_deadline(task) for task in tasks),
+            sum((task['period'] - get_deadline(task)) * task['burst'] / task['period']
+                for task in tasks) / (1 - total)
+        ))
+
+    # Quick Processor-demand Analysis (Zhang & Burns)
+    smallest = min(get_deadline(task) for task in tasks)
+    t = last_deadline_before(tasks, limit + 1e-9)
+    h = demand(tasks, t)
+    while h <= t and h > smallest:
+        t = h if h < t else last_deadline_before(tasks, t)
+        h = demand(tasks, t)
+    return h <= smallest, "processor demand (QPA)"
+
+
+def analyze(tasks, algorithm):
+    """Schedulability verdict for a task set without simulating the hyperperiod"""
+    validate(tasks)
+    if algorithm == "EDF":
+        schedulable, test = edf_schedulable(tasks)
+    elif algorithm == "RM":
+        schedulable, test = rm_schedulable(tasks)
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    return {
+        'utilization': utilization(tasks),
+        'schedulable': schedulable,
+        'test': test
+    }
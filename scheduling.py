@@ -0,0 +1,366 @@
+"""Scheduling algorithms shared by the window, batch mode and the fuzzer.
+
+run_algorithm dispatches by name to the event engine (engine.py) or the
+real-time simulator (realtime.py). The original step-by-step implementations
+of the classic algorithms are kept here as the reference the engine is
+checked against (see fuzz.py) and are reached through run_reference.
+compute_statistics summarizes per-process results for the comparison view
+and batch statistics. Nothing here imports tkinter, so worker processes and
+headless tools can use it without loading the GUI.
+"""
+import copy
+from collections import deque
+
+import engine
+import policies
+import realtime
+from timeline import GanttTimeline
+
+# Classic algorithms, run side by side by "Compare All"; the selection list
+# shows every policy registered in policies.py plus the real-time ones
+ALGORITHMS = [
+    ("First Come First Serve (FCFS)", "FCFS"),
+    ("Shortest Job First (SJF)", "SJF"),
+    ("Shortest Remaining Time First (SRTF)", "SRTF"),
+    ("Round Robin (RR)", "RR"),
+    ("Priority (Preemptive)", "Priority_Preemptive"),
+    ("Priority (Non-Preemptive)", "Priority_NonPreemptive")
+]
+
+# Periodic real-time policies (need period/deadline columns, not part of Compare All)
+REALTIME_ALGORITHMS = [
+    ("Earliest Deadline First (EDF)", "EDF"),
+    ("Rate Monotonic (RM)", "RM")
+]
+
+
+def uses_quantum(algorithm):
+    """Whether the algorithm needs a time quantum"""
+    policy = policies.POLICIES.get(algorithm)
+    return policy is not None and policy.uses_quantum
+
+
+def uses_seed(algorithm):
+    """Whether the algorithm needs a random seed"""
+    policy = policies.POLICIES.get(algorithm)
+    return policy is not None and policy.uses_seed
+
+
+def run_algorithm(algorithm, processes, quantum=None, seed=None):
+    """Run a scheduling algorithm by name (safe to call from worker processes)"""
+    if algorithm in realtime.ALGORITHMS:
+        return realtime.simulate(processes, algorithm)
+    return engine.simulate(processes, algorithm, quantum, seed=seed)
+
+
+def run_reference(algorithm, processes, quantum=None):
+    """Run the original step-by-step implementation of a classic algorithm"""
+    if algorithm == "FCFS":
+        return fcfs(processes)
+    elif algorithm == "SJF":
+        return sjf(processes)
+    elif algorithm == "SRTF":
+        return srtf(processes)
+    elif algorithm == "RR":
+        return round_robin(processes, quantum)
+    elif algorithm == "Priority_Preemptive":
+        return priority_preemptive(processes)
+    elif algorithm == "Priority_NonPreemptive":
+        return priority_non_preemptive(processes)
+    raise ValueError(f"Unknown algorithm: {algorithm}")
+
+
+def fcfs(processes):
+    """First Come First Serve algorithm"""
+    processes.sort(key=lambda x: x['arrival'])
+    current_time = 0
+    results = []
+    gantt_chart = GanttTimeline()
+
+    for process in processes:
+        start_time = max(current_time, process['arrival'])
+        completion_time = start_time + process['burst']
+        turnaround_time = completion_time - process['arrival']
+        waiting_time = turnaround_time - process['burst']
+
+        results.append({
+            'pid': process['pid'],
+            'arrival': process['arrival'],
+            'burst': process['burst'],
+            'start': start_time,
+            'completion': completion_time,
+            'turnaround': turnaround_time,
+            'waiting': waiting_time
+        })
+
+        gantt_chart.append(process['pid'], start_time, completion_time)
+
+        current_time = completion_time
+
+    return {'results': results, 'gantt': gantt_chart}
+
+
+def sjf(processes):
+    """Shortest Job First (Non-preemptive) algorithm"""
+    n = len(processes)
+    completed = 0
+    current_time = 0
+    results = []
+    gantt_chart = GanttTimeline()
+    processes_copy = copy.deepcopy(processes)
+
+    while completed != n:
+        available = [p for p in processes_copy if p['arrival'] <= current_time and p['remaining'] > 0]
+
+        if not available:
+            current_time += 1
+            continue
+
+        # Select process with shortest burst time
+        selected = min(available, key=lambda x: x['burst'])
+
+        start_time = current_time
+        completion_time = current_time + selected['burst']
+        turnaround_time = completion_time - selected['arrival']
+        waiting_time = turnaround_time - selected['burst']
+
+        results.append({
+            'pid': selected['pid'],
+            'arrival': selected['arrival'],
+            'burst': selected['burst'],
+            'start': start_time,
+            'completion': completion_time,
+            'turnaround': turnaround_time,
+            'waiting': waiting_time
+        })
+
+        gantt_chart.append(selected['pid'], start_time, completion_time)
+
+        selected['remaining'] = 0
+        current_time = completion_time
+        completed += 1
+
+    return {'results': sorted(results, key=lambda x: x['pid']), 'gantt': gantt_chart}
+
+
+def srtf(processes):
+    """Shortest Remaining Time First (Preemptive) algorithm"""
+    n = len(processes)
+    completed = 0
+    current_time = 0
+    results = [None] * n
+    gantt_chart = GanttTimeline()
+    processes_copy = copy.deepcopy(processes)
+
+    while completed != n:
+        available = [p for p in processes_copy if p['arrival'] <= current_time and p['remaining'] > 0]
+
+        if not available:
+            current_time += 1
+            continue
+
+        # Select process with shortest remaining time
+        selected = min(available, key=lambda x: x['remaining'])
+
+        # Consecutive ticks of the same process merge into one segment
+        gantt_chart.append(selected['pid'], current_time, current_time + 1)
+
+        selected['remaining'] -= 1
+
+        if selected['remaining'] == 0:
+            completion_time = current_time + 1
+            turnaround_time = completion_time - selected['arrival']
+            waiting_time = turnaround_time - selected['burst']
+
+            results[selected['pid'] - 1] = {
+                'pid': selected['pid'],
+                'arrival': selected['arrival'],
+                'burst': selected['burst'],
+                'start': gantt_chart.first_start(selected['pid']),
+                'completion': completion_time,
+                'turnaround': turnaround_time,
+                'waiting': waiting_time
+            }
+            completed += 1
+
+        current_time += 1
+
+    return {'results': results, 'gantt': gantt_chart}
+
+
+def round_robin(processes, quantum):
+    """Round Robin algorithm"""
+    n = len(processes)
+    queue = deque()
+    current_time = 0
+    results = [None] * n
+    gantt_chart = GanttTimeline()
+    processes_copy = copy.deepcopy(processes)
+    completed = 0
+
+    # Add processes that arrive at time 0
+    for process in processes_copy:
+        if process['arrival'] == 0:
+            queue.append(process)
+
+    while completed < n:
+        if not queue:
+            # Find next arriving process
+            next_arrival = min([p['arrival'] for p in processes_copy if p['remaining'] > 0])
+            current_time = next_arrival
+            for process in processes_copy:
+                if process['arrival'] == current_time and process['remaining'] > 0:
+                    queue.append(process)
+            continue
+
+        current_process = queue.popleft()
+
+        if current_process['remaining'] > 0:
+            # Execute for quantum time or remaining time, whichever is smaller
+            execution_time = min(quantum, current_process['remaining'])
+
+            gantt_chart.append(current_process['pid'], current_time, current_time + execution_time)
+
+            current_process['remaining'] -= execution_time
+            current_time += execution_time
+
+            # Add newly arrived processes to queue
+            for process in processes_copy:
+                if (process['arrival'] <= current_time and
+                    process['remaining'] > 0 and
+                    process not in queue and
+                    process != current_process):
+                    queue.append(process)
+
+            if current_process['remaining'] == 0:
+                # Process completed
+                completion_time = current_time
+                turnaround_time = completion_time - current_process['arrival']
+                waiting_time = turnaround_time - current_process['burst']
+
+                results[current_process['pid'] - 1] = {
+                    'pid': current_process['pid'],
+                    'arrival': current_process['arrival'],
+                    'burst': current_process['burst'],
+                    'start': gantt_chart.first_start(current_process['pid']),
+                    'completion': completion_time,
+                    'turnaround': turnaround_time,
+                    'waiting': waiting_time
+                }
+                completed += 1
+            else:
+                # Process not completed, add back to queue
+                queue.append(current_process)
+
+    return {'results': results, 'gantt': gantt_chart}
+
+
+def priority_preemptive(processes):
+    """Priority Scheduling (Preemptive) algorithm"""
+    n = len(processes)
+    completed = 0
+    current_time = 0
+    results = [None] * n
+    gantt_chart = GanttTimeline()
+    processes_copy = copy.deepcopy(processes)
+
+    while completed != n:
+        available = [p for p in processes_copy if p['arrival'] <= current_time and p['remaining'] > 0]
+
+        if not available:
+            current_time += 1
+            continue
+
+        # Select process with highest priority (lowest priority number)
+        selected = min(available, key=lambda x: x['priority'])
+
+        # Consecutive ticks of the same process merge into one segment
+        gantt_chart.append(selected['pid'], current_time, current_time + 1)
+
+        selected['remaining'] -= 1
+
+        if selected['remaining'] == 0:
+            completion_time = current_time + 1
+            turnaround_time = completion_time - selected['arrival']
+            waiting_time = turnaround_time - selected['burst']
+
+            results[selected['pid'] - 1] = {
+                'pid': selected['pid'],
+                'arrival': selected['arrival'],
+                'burst': selected['burst'],
+                'priority': selected['priority'],
+                'start': gantt_chart.first_start(selected['pid']),
+                'completion': completion_time,
+                'turnaround': turnaround_time,
+                'waiting': waiting_time
+            }
+            completed += 1
+
+        current_time += 1
+
+    return {'results': results, 'gantt': gantt_chart}
+
+
+def priority_non_preemptive(processes):
+    """Priority Scheduling (Non-preemptive) algorithm"""
+    n = len(processes)
+    completed = 0
+    current_time = 0
+    results = []
+    gantt_chart = GanttTimeline()
+    processes_copy = copy.deepcopy(processes)
+
+    while completed != n:
+        available = [p for p in processes_copy if p['arrival'] <= current_time and p['remaining'] > 0]
+
+        if not available:
+            current_time += 1
+            continue
+
+        # Select process with highest priority (lowest priority number)
+        selected = min(available, key=lambda x: x['priority'])
+
+        start_time = current_time
+        completion_time = current_time + selected['burst']
+        turnaround_time = completion_time - selected['arrival']
+        waiting_time = turnaround_time - selected['burst']
+
+        results.append({
+            'pid': selected['pid'],
+            'arrival': selected['arrival'],
+            'burst': selected['burst'],
+            'priority': selected['priority'],
+            'start': start_time,
+            'completion': completion_time,
+            'turnaround': turnaround_time,
+            'waiting': waiting_time
+        })
+
+        gantt_chart.append(selected['pid'], start_time, completion_time)
+
+        selected['remaining'] = 0
+        current_time = completion_time
+        completed += 1
+
+    return {'results': sorted(results, key=lambda x: x['pid']), 'gantt': gantt_chart}
+
+
+def compute_statistics(results, gantt=None):
+    """Summarize per-process results (None when there is nothing to summarize)"""
+    valid_results = [r for r in results if r is not None]
+    if not valid_results:
+        return None
+
+    total_time = max(r['completion'] for r in valid_results)
+    if gantt is not None:
+        busy_time = gantt.busy_time()
+    else:
+        busy_time = sum(r['burst'] for r in valid_results)
+    return {
+        'count': len(valid_results),
+        'avg_turnaround': sum(r['turnaround'] for r in valid_results) / len(valid_results),
+        'avg_waiting': sum(r['waiting'] for r in valid_results) / len(valid_results),
+        'throughput': len(valid_results) / total_time,
+        'total_time': total_time,
+        'cpu_utilization': busy_time / total_time
+    }
@@ -0,0 +1,162 @@
+"""Run-length-coalesced Gantt timeline with interval queries.
+
+Segments are appended in time order and stored in parallel lists (pids,
+starts, ends); a segment that continues the previous one for the same pid
+is merged into it. Cumulative busy time is kept alongside, and a per-pid
+index is brought up to date on the first per-pid query after an append, so
+the queries below are O(log n) with bisect:
+
+    timeline.pid_at(t)              who was running at time t (None if idle)
+    timeline.segments(t0, t1)       segments overlapping [t0, t1)
+    timeline.cpu_time(pid, t0, t1)  CPU time of pid within [t0, t1)
+    timeline.busy_time(t0, t1)      CPU time of all pids within [t0, t1)
+
+For code that walks Gantt charts, the timeline also behaves as a read-only
+sequence of {'pid', 'start', 'end'} dicts.
+"""
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from operator import sub
+
+
+class PidSegments:
+    """Segments of a single pid with cumulative CPU time"""
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.before = []    # CPU time of this pid before each segment
+
+
+class GanttTimeline:
+    """Gantt chart stored as parallel lists of coalesced (pid, start, end) segments"""
+
+    def __init__(self, segments=()):
+        self.pids = []
+        self.starts = []
+        self.ends = []
+        self.before = []    # total CPU time before each segment
+        self.by_pid = {}
+        self.indexed = 0    # segments already folded into by_pid
+        for segment in segments:
+            self.append(segment['pid'], segment['start'], segment['end'])
+
+    @classmethod
+    def from_columns(cls, pids, starts, ends):
+        """Build a timeline from parallel lists of already coalesced, ordered segments"""
+        timeline = cls()
+        timeline.pids = list(pids)
+        timeline.starts = list(starts)
+        timeline.ends = list(ends)
+        timeline.before = [0] + list(accumulate(map(sub, timeline.ends, timeline.starts)))[:-1]
+        if not timeline.pids:
+            timeline.before = []
+        return timeline
+
+    def append(self, pid, start, end):
+        """Add a segment, merging it into the last one if pid continues running"""
+        if end <= start:
+            return
+        if self.ends and start < self.ends[-1]:
+            raise ValueError("Gantt segments must be appended in time order")
+
+        if self.pids and self.pids[-1] == pid and self.ends[-1] == start:
+            self.ends[-1] = end
+            return
+
+        self.before.append(self.before[-1] + self.ends[-1] - self.starts[-1] if self.pids else 0)
+        self.pids.append(pid)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def pid_segments(self, pid):
+        """Segments of one pid, folding segments appended since the last query into the index"""
+        if self.indexed:
+            # The last indexed segment may have been extended by a merge since
+            self.by_pid[self.pids[self.indexed - 1]].ends[-1] = self.ends[self.indexed - 1]
+        for i in range(self.indexed, len(self.pids)):
+            per_pid = self.by_pid.get(self.pids[i])
+            if per_pid is None:
+                per_pid = self.by_pid[self.pids[i]] = PidSegments()
+            per_pid.before.append(
+                per_pid.before[-1] + per_pid.ends[-1] - per_pid.starts[-1] if per_pid.starts else 0
+            )
+            per_pid.starts.append(self.starts[i])
+            per_pid.ends.append(self.ends[i])
+        self.indexed = len(self.pids)
+        return self.by_pid.get(pid)
+
+    @property
+    def end(self):
+        """Time the last segment ends (0 when empty)"""
+        return self.ends[-1] if self.ends else 0
+
+    def pid_at(self, t):
+        """Pid running at time t, or None if the CPU was idle"""
+        i = bisect_right(self.starts, t) - 1
+        if i >= 0 and t < self.ends[i]:
+            return self.pids[i]
+        return None
+
+    def segments(self, t0, t1):
+        """Segments overlapping [t0, t1), unclipped"""
+        first = bisect_right(self.ends, t0)
+        last = bisect_left(self.starts, t1)
+        return [self[i] for i in range(first, last)]
+
+    def first_start(self, pid):
+        """Time pid first ran (None if it never ran)"""
+        per_pid = self.pid_segments(pid)
+        return per_pid.starts[0] if per_pid else None
+
+    def cpu_time(self, pid, t0=None, t1=None):
+        """CPU time pid received within [t0, t1) (whole timeline by default)"""
+        per_pid = self.pid_segments(pid)
+        if per_pid is None:
+            return 0
+        return self.covered(per_pid.starts, per_pid.ends, per_pid.before, t0, t1)
+
+    def busy_time(self, t0=None, t1=None):
+        """CPU time of all pids within [t0, t1) (whole timeline by default)"""
+        return self.covered(self.starts, self.ends, self.before, t0, t1)
+
+    @staticmethod
+    def covered(starts, ends, before, t0, t1):
+        """Length of the union of sorted disjoint segments clipped to [t0, t1)"""
+        if not starts:
+            return 0
+        if t0 is None:
+            t0 = starts[0]
+        if t1 is None:
+            t1 = ends[-1]
+
+        def prefix(t):
+            # Busy time in (-inf, t)
+            i = bisect_right(starts, t) - 1
+            if i < 0:
+                return 0
+            return before[i] + min(t, ends[i]) - starts[i]
+
+        return max(0, prefix(t1) - prefix(t0))
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return {'pid': self.pids[i], 'start': self.starts[i], 'end': self.ends[i]}
+
+    def __iter__(self):
+        for pid, start, end in zip(self.pids, self.starts, self.ends):
+            yield {'pid': pid, 'start': start, 'end': end}
+
+    def __bool__(self):
+        return bool(self.pids)
+
+    def to_list(self):
+        """Segments as a list of dicts"""
+        return list(self)
+
+    def __repr__(self):
+        return f"GanttTimeline({self.to_list()!r})"
@@ -0,0 +1,175 @@
+"""CPU utilization, ready-queue length and completion time series.
+
+Engines emit event deltas: (time, +1/-1) whenever a process joins or leaves
+the ready queue and the time of every completion; CPU busy deltas come from
+the Gantt timeline. Each series is folded into a prefix-sum array over a
+uniform time grid in one O(n + grid) pass, after which the aggregate over
+any grid-aligned window is two array lookups:
+
+    series = TimeSeries.from_schedule(run['results'], run['gantt'], run.get('deltas'))
+    series.utilization(100, 200)      # fraction of [100, 200) the CPU was busy
+    series.queue_length(100, 200)     # mean ready-queue length over the window
+    series.sample(700)                # per-column averages for a 700 px chart
+
+Window bounds are rounded down to the grid, whose resolution is 1 time unit
+unless the run is longer than MAX_POINTS units.
+"""
+import math
+
+MAX_POINTS = 1 << 20
+
+# Step-function series (integrated over time) and event-count series
+LEVELS = ('busy', 'ready')
+COUNTS = ('completed',)
+
+
+def deltas_from_schedule(results, gantt):
+    """Derive event deltas from per-process results and a Gantt timeline
+
+    Only valid for processes that are ready from arrival to completion
+    except while running (no I/O bursts); the event engines emit exact
+    deltas themselves.
+    """
+    ready = []
+    completed = []
+    for r in results:
+        if r is None:
+            continue
+        ready.append((r['arrival'], 1))
+        ready.append((r['completion'], -1))
+        completed.append(r['completion'])
+    for start, end in zip(gantt.starts, gantt.ends):
+        ready.append((start, -1))
+        ready.append((end, 1))
+    return {'ready': ready, 'completed': completed}
+
+
+def gantt_deltas(gantt):
+    """CPU busy deltas: +1 at the start and -1 at the end of every segment"""
+    deltas = []
+    for start, end in zip(gantt.starts, gantt.ends):
+        deltas.append((start, 1))
+        deltas.append((end, -1))
+    return deltas
+
+
+class TimeSeries:
+    """Prefix sums of scheduling event deltas on a uniform time grid"""
+
+    def __init__(self, deltas, end, resolution=None):
+        if resolution is None:
+            resolution = max(1, math.ceil(end / MAX_POINTS))
+        if resolution <= 0:
+            raise ValueError("Resolution must be positive")
+        self.resolution = resolution
+        self.end = end
+        self.size = max(1, math.ceil(end / resolution))   # number of grid cells
+
+        # prefix[name][g] is the integral (levels) or count (events) over [0, g * resolution)
+        self.prefix = {}
+        for name in LEVELS:
+            self.prefix[name] = self.integrate(deltas.get(name, ()))
+        for name in COUNTS:
+            self.prefix[name] = self.count(deltas.get(name, ()))
+
+    @classmethod
+    def from_schedule(cls, results, gantt, deltas=None, resolution=None):
+        """Build the series of a finished run, deriving deltas when the engine gave none"""
+        if deltas is None:
+            deltas = deltas_from_schedule(results, gantt)
+        deltas = dict(deltas, busy=gantt_deltas(gantt))
+        end = max([gantt.end] + [r['completion'] for r in results if r is not None])
+        return cls(deltas, end, resolution)
+
+    def cell(self, t):
+        """Index of the grid point at or before t, clamped to the grid"""
+        return min(self.size, max(0, int(t // self.resolution)))
+
+    def integrate(self, deltas):
+        """Prefix integral of the step function whose level changes by delta at each time
+
+        Grid point g sees every change at t < g * resolution, so its integral
+        is sum(delta * (g * resolution - t)) = level(g) * g * resolution - moment(g).
+        """
+        level = [0] * (self.size + 1)
+        moment = [0] * (self.size + 1)
+        for t, delta in deltas:
+            g = int(t // self.resolution) + 1
+            if g <= self.size:
+                level[g] += delta
+                moment[g] += delta * t
+
+        prefix = [0] * (self.size + 1)
+        running_level = 0
+        running_moment = 0
+        for g in range(1, self.size + 1):
+            running_level += level[g]
+            running_moment += moment[g]
+            prefix[g] = running_level * g * self.resolution - running_moment
+        return prefix
+
+    def count(self, times):
+        """Prefix count of events; events at the very end fall into the last cell"""
+        counts = [0] * (self.size + 1)
+        for t in times:
+            counts[min(self.size, int(t // self.resolution) + 1)] += 1
+
+        prefix = [0] * (self.size + 1)
+        total = 0
+        for g in range(1, self.size + 1):
+            total += counts[g]
+            prefix[g] = total
+        return prefix
+
+    def window(self, t0=None, t1=None):
+        """Grid indices (g0, g1) of a window, defaulting to the whole run"""
+        g0 = 0 if t0 is None else self.cell(t0)
+        g1 = self.size if t1 is None else self.cell(t1)
+        return g0, max(g0, g1)
+
+    def total(self, name, t0=None, t1=None):
+        """Integral (busy, ready) or count (completed) of a series over [t0, t1)"""
+        g0, g1 = self.window(t0, t1)
+        return self.prefix[name][g1] - self.prefix[name][g0]
+
+    def mean(self, name, t0=None, t1=None):
+        """Time average of a series over [t0, t1)"""
+        g0, g1 = self.window(t0, t1)
+        if g1 == g0:
+            return 0
+        return (self.prefix[name][g1] - self.prefix[name][g0]) / ((g1 - g0) * self.resolution)
+
+    def utilization(self, t0=None, t1=None):
+        """Fraction of [t0, t1) the CPU was busy"""
+        return self.mean('busy', t0, t1)
+
+    def queue_length(self, t0=None, t1=None):
+        """Mean number of ready (waiting, not running) processes over [t0, t1)"""
+        return self.mean('ready', t0, t1)
+
+    def completions(self, t0=None, t1=None):
+        """Number of completions in [t0, t1)"""
+        return self.total('completed', t0, t1)
+
+    def throughput(self, t0=None, t1=None):
+        """Completions per time unit over [t0, t1)"""
+        return self.mean('completed', t0, t1)
+
+    def sample(self, points):
+        """Split the run into at most points equal windows and average each series
+
+        Returns a dict of parallel lists: 'time' (window start),
+        'utilization', 'queue_length' and 'throughput'.
+        """
+        points = max(1, min(points, self.size))
+        samples = {'time': [], 'utilization': [], 'queue_length': [], 'throughput': []}
+        for k in range(points):
+            g0 = k * self.size // points
+            g1 = (k + 1) * self.size // points
+            span = (g1 - g0) * self.resolution
+            samples['time'].append(g0 * self.resolution)
+            for key, name in (('utilization', 'busy'), ('queue_length', 'ready'),
+                              ('throughput', 'completed')):
+                values = self.prefix[name]
+                samples[key].append((values[g1] - values[g0]) / span)
+        return samples
@@ -0,0 +1,270 @@
+"""Import recorded Linux scheduler traces as workloads.
+
+Reads the text output of ``perf sched script`` / ``perf script``, ftrace
+(``/sys/kernel/tracing/trace``) or ``trace-cmd report`` and turns the
+sched_wakeup / sched_switch / sched_process_exit events into arrival/burst
+records. A job is one CPU burst of a thread: it arrives when the thread is
+woken (or first seen running) and its burst is the on-CPU time until the
+thread blocks or exits; preemptions (prev_state R) do not end a job.
+
+The parser streams the file line by line and keeps state only for threads
+that are currently runnable, so multi-GB traces (optionally gzip
+compressed) are read in bounded memory. Jobs complete out of arrival order;
+iter_arrivals restores arrival order through a small reorder heap, and
+replay_trace feeds them straight into the incremental engine
+(Engine.submit / advance) instead of building the workload first:
+
+    run = replay_trace("sched.txt.gz", "SRTF")
+"""
+import gzip
+import heapq
+import re
+from array import array
+from collections import OrderedDict
+from itertools import islice
+
+import policies
+from engine import Engine
+
+# Event name and payload; the timestamp is the last "<seconds>.<fraction>:"
+# before the event name in every supported format
+EVENT = re.compile(r'\s(\d+\.\d+):\s+(?:\S+:)?(sched_switch|sched_wakeup_new|sched_wakeup|sched_process_exit):\s*(.*)$')
+
+# ftrace / older perf: key=value fields
+SWITCH_FIELDS = re.compile(
+    r'prev_comm=(.*?) prev_pid=(\d+) prev_prio=(\d+) prev_state=(\S+) ==> '
+    r'next_comm=(.*?) next_pid=(\d+) next_prio=(\d+)'
+)
+TASK_FIELDS = re.compile(r'comm=(.*?) pid=(\d+) prio=(\d+)')
+
+# trace-cmd report / newer perf: "comm:pid [prio] state ==> comm:pid [prio]"
+SWITCH_COMPACT = re.compile(r'(.*):(\d+) \[(\d+)\] (\S+) ==> (.*):(\d+) \[(\d+)\]')
+TASK_COMPACT = re.compile(r'(.*):(\d+) \[(\d+)\]')
+
+# Thread states at switch-out that leave it runnable (preempted)
+RUNNABLE_STATES = ('R', 'R+')
+
+# Most jobs iter_arrivals holds back waiting for an earlier arrival to
+# complete (a thread that stays runnable for the whole trace would otherwise
+# hold back everything after it)
+REORDER_WINDOW = 100_000
+
+# Most jobs load_trace materializes; longer traces need limit or replay_trace
+MAX_JOBS = 2_000_000
+
+# replay_trace advances the engine after every SUBMIT_BATCH submissions, which
+# bounds its arrival heap without paying advance()'s setup per job
+SUBMIT_BATCH = 4096
+
+# Workload columns of a replayed trace, as hashed by history.workload_hash
+WORKLOAD_COLUMNS = ('pid', 'arrival', 'burst', 'priority')
+
+
+def parse_event(line):
+    """Parse one trace line into (timestamp, event, fields) or None
+
+    fields is (comm, pid, prio) for wakeup/exit events and
+    (prev_comm, prev_pid, prev_prio, prev_state, next_comm, next_pid, next_prio)
+    for sched_switch.
+    """
+    if 'sched_' not in line:
+        return None
+    match = EVENT.search(line)
+    if match is None:
+        return None
+    timestamp, event, payload = match.groups()
+
+    if event == 'sched_switch':
+        fields = SWITCH_FIELDS.search(payload) or SWITCH_COMPACT.match(payload)
+        if fields is None:
+            return None
+        prev_comm, prev_pid, prev_prio, prev_state, next_comm, next_pid, next_prio = fields.groups()
+        return float(timestamp), event, (prev_comm, int(prev_pid), int(prev_prio), prev_state,
+                                         next_comm, int(next_pid), int(next_prio))
+
+    fields = TASK_FIELDS.search(payload) or TASK_COMPACT.match(payload)
+    if fields is None:
+        return None
+    comm, pid, prio = fields.groups()
+    return float(timestamp), event, (comm, int(pid), int(prio))
+
+
+def iter_jobs(lines):
+    """Yield CPU-burst jobs from trace lines as they complete
+
+    Each job is a dict with 'tid', 'comm', 'priority' (kernel prio, lower is
+    more important), 'arrival' and 'burst' in seconds. Jobs are yielded in
+    completion order, not arrival order; no job yielded later arrives before
+    'horizon' (the arrival of the oldest thread still runnable).
+    """
+    # tid -> [comm, prio, arrival, burst, on_cpu_since]; runnable threads only,
+    # in the order they became runnable, so the first one arrived earliest
+    threads = OrderedDict()
+
+    def finish(tid, now):
+        comm, prio, arrival, burst, _ = threads.pop(tid)
+        if burst > 0:
+            horizon = threads[next(iter(threads))][2] if threads else now
+            return {'tid': tid, 'comm': comm, 'priority': prio, 'arrival': arrival,
+                    'burst': burst, 'horizon': horizon}
+        return None
+
+    for line in lines:
+        parsed = parse_event(line)
+        if parsed is None:
+            continue
+        timestamp, event, fields = parsed
+
+        if event == 'sched_switch':
+            prev_comm, prev_pid, prev_prio, prev_state, next_comm, next_pid, next_prio = fields
+
+            state = threads.get(prev_pid)
+            if prev_pid != 0 and state is not None and state[4] is not None:
+                state[3] += timestamp - state[4]
+                state[4] = None
+                if prev_state not in RUNNABLE_STATES:
+                    job = finish(prev_pid, timestamp)
+                    if job is not None:
+                        yield job
+
+            if next_pid != 0:
+                state = threads.get(next_pid)
+                if state is None:
+                    # Running without a recorded wakeup (e.g. trace started late)
+                    state = threads[next_pid] = [next_comm, next_prio, timestamp, 0.0, None]
+                state[4] = timestamp
+
+        elif event == 'sched_process_exit':
+            comm, pid, prio = fields
+            state = threads.get(pid)
+            if state is not None:
+                if state[4] is not None:
+                    state[3] += timestamp - state[4]
+                job = finish(pid, timestamp)
+                if job is not None:
+                    yield job
+
+        else:  # sched_wakeup / sched_wakeup_new
+            comm, pid, prio = fields
+            if pid != 0 and pid not in threads:
+                threads[pid] = [comm, prio, timestamp, 0.0, None]
+
+    # Threads still runnable when the trace ends
+    for tid in list(threads):
+        state = threads[tid]
+        if state[4] is not None:
+            del threads[tid]  # still on CPU: burst length unknown
+            continue
+        job = finish(tid, state[2])
+        if job is not None:
+            yield job
+
+
+def iter_arrivals(lines):
+    """Yield the jobs of iter_jobs in arrival order
+
+    A completed job is held in a heap until every job still to come arrives
+    after it (see 'horizon'). At most REORDER_WINDOW jobs are held; beyond
+    that the earliest is released anyway, and a job arriving before an
+    already released one is moved to that one's arrival so the order holds.
+    """
+    # Heap of (arrival, burst, priority, tid, sequence, job): simultaneous
+    # arrivals are ordered by burst, priority and thread
+    pending = []
+    released = float('-inf')
+    for sequence, job in enumerate(iter_jobs(lines)):
+        if job['arrival'] < released:
+            job['arrival'] = released
+        heapq.heappush(pending, (job['arrival'], job['burst'], job['priority'], job['tid'], sequence, job))
+        while pending and (pending[0][0] < job['horizon'] or len(pending) > REORDER_WINDOW):
+            released = pending[0][0]
+            yield heapq.heappop(pending)[-1]
+    while pending:
+        yield heapq.heappop(pending)[-1]
+
+
+def open_trace(path):
+    """Open a text trace, transparently decompressing .gz files"""
+    if str(path).endswith('.gz'):
+        return gzip.open(path, 'rt', errors='replace')
+    return open(path, 'r', errors='replace', buffering=1 << 20)
+
+
+def iter_processes(lines, unit=1e-6):
+    """Yield the jobs of a trace as process dicts, in arrival order
+
+    Times are converted to integer multiples of unit (microseconds by
+    default) relative to the first arrival; bursts are at least 1. Processes
+    are numbered P1, P2, ... in arrival order; 'tid' and 'comm' identify the
+    traced thread.
+    """
+    origin = None
+    for pid, job in enumerate(iter_arrivals(lines), start=1):
+        if origin is None:
+            origin = job['arrival']
+        burst = max(1, round(job['burst'] / unit))
+        yield {
+            'pid': pid,
+            'arrival': round((job['arrival'] - origin) / unit),
+            'burst': burst,
+            'priority': job['priority'],
+            'remaining': burst,
+            'tid': job['tid'],
+            'comm': job['comm']
+        }
+
+
+def check_algorithm(algorithm):
+    """Raise ValueError unless the algorithm can schedule trace jobs
+
+    Trace jobs only carry WORKLOAD_COLUMNS, so real-time algorithms (no
+    periods) and policies reading other per-process fields (the tickets of
+    Lottery and Stride) cannot run on them.
+    """
+    policy = policies.POLICIES.get(algorithm)
+    if policy is None:
+        raise ValueError(f"{algorithm} cannot schedule trace jobs, which have no periods or deadlines")
+    missing = [field for field in policy.fields if field not in WORKLOAD_COLUMNS]
+    if missing:
+        raise ValueError(f"{algorithm} needs {' and '.join(missing)}, which traces do not record")
+
+
+def load_trace(path, unit=1e-6, limit=None):
+    """Read a trace file into process dicts ready for the scheduling engines
+
+    See iter_processes for the fields. limit keeps the first jobs by
+    arrival. The whole workload is held in memory, so at most MAX_JOBS jobs
+    are read; longer traces raise ValueError unless limit is given (or use
+    replay_trace, which does not build the workload).
+    """
+    with open_trace(path) as lines:
+        processes = list(islice(iter_processes(lines, unit), limit if limit is not None else MAX_JOBS + 1))
+    if limit is None and len(processes) > MAX_JOBS:
+        raise ValueError(f"Trace has more than {MAX_JOBS} jobs; pass a limit or replay it instead")
+    return processes
+
+
+def replay_trace(path, algorithm, quantum=None, seed=None, unit=1e-6, limit=None):
+    """Simulate a trace file under a registered policy while it is being read
+
+    Jobs are submitted to an engine.Engine in arrival order and the engine
+    is advanced as they come in, so no process list is built or sorted. Returns the result
+    of engine.simulate() plus 'workload', the columns WORKLOAD_COLUMNS of
+    the replayed jobs as arrays (for history.hash_columns). limit keeps the
+    first jobs by arrival. The engine's per-process state and the results
+    still grow with the number of jobs; parsing and reordering do not.
+    """
+    check_algorithm(algorithm)
+    simulation = Engine(policies.create(algorithm, quantum, seed))
+    columns = {name: array('q') for name in WORKLOAD_COLUMNS}
+    with open_trace(path) as lines:
+        for count, process in enumerate(islice(iter_processes(lines, unit), limit), start=1):
+            if count % SUBMIT_BATCH == 0:
+                simulation.advance(process['arrival'])
+            simulation.submit({name: process[name] for name in WORKLOAD_COLUMNS})
+            for name, column in columns.items():
+                column.append(process[name])
+    simulation.advance()
+    run = simulation.result()
+    run['workload'] = columns
+    return run